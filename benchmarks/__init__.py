@@ -0,0 +1 @@
+"""Benchmarks for MkAPI with synthetic packages."""
@@ -0,0 +1,188 @@
+"""Generate synthetic packages for benchmarks.
+
+A package consists of subpackages of up to ten modules each. Every module
+defines classes with methods and module-level functions, all documented
+with Google style docstrings. Docstrings contain cross-references to
+randomly chosen classes in the package, so that link resolution is
+exercised as well.
+"""
+
+from __future__ import annotations
+
+import random
+import textwrap
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MODULES_PER_SUBPACKAGE = 10
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do "
+    "eiusmod tempor incididunt ut labore et dolore magna aliqua."
+)
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Represent the size of a synthetic package."""
+
+    modules: int = 10
+    """The number of modules."""
+
+    classes: int = 5
+    """The number of classes per module."""
+
+    methods: int = 5
+    """The number of methods per class."""
+
+    doc_lines: int = 3
+    """The number of lines of the description in each docstring."""
+
+    refs: int = 2
+    """The number of cross-references in each docstring."""
+
+    def __str__(self) -> str:
+        return (
+            f"modules={self.modules} classes={self.classes} "
+            f"methods={self.methods} doc_lines={self.doc_lines} refs={self.refs}"
+        )
+
+
+def get_module_names(package: str, scale: Scale) -> list[str]:
+    """Return the names of the modules in a synthetic package.
+
+    Args:
+        package (str): The name of the package.
+        scale (Scale): The size of the package.
+
+    Returns:
+        list[str]: The fully qualified names of the modules.
+
+    Examples:
+        >>> get_module_names("pkg", Scale(modules=3))
+        ['pkg.sub0.mod0', 'pkg.sub0.mod1', 'pkg.sub0.mod2']
+
+    """
+    names = []
+    for k in range(scale.modules):
+        sub, mod = divmod(k, MODULES_PER_SUBPACKAGE)
+        names.append(f"{package}.sub{sub}.mod{mod}")
+
+    return names
+
+
+def generate_package(root: Path, package: str, scale: Scale, seed: int = 0) -> Path:
+    """Generate a synthetic package in a directory.
+
+    Args:
+        root (Path): The directory to write the package into.
+        package (str): The name of the package.
+        scale (Scale): The size of the package.
+        seed (int): The seed for choosing cross-references.
+
+    Returns:
+        Path: The path of the package directory.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    modules = get_module_names(package, scale)
+    classes = [f"{m}.Class{c}" for m in modules for c in range(scale.classes)]
+
+    path = root / package
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "__init__.py").write_text(f'"""The {package} package."""\n')
+
+    for module in modules:
+        *_, sub, mod = module.split(".")
+        directory = path / sub
+
+        if not directory.exists():
+            directory.mkdir()
+            doc = f'"""The {sub} subpackage."""\n'
+            (directory / "__init__.py").write_text(doc)
+
+        source = generate_module(module, scale, classes, rng)
+        (directory / f"{mod}.py").write_text(source)
+
+    return path
+
+
+def generate_module(
+    module: str,
+    scale: Scale,
+    classes: list[str],
+    rng: random.Random,
+) -> str:
+    """Return the source of a synthetic module.
+
+    Args:
+        module (str): The name of the module.
+        scale (Scale): The size of the package.
+        classes (list[str]): The names of the classes to refer to.
+        rng (random.Random): The random generator for choosing references.
+
+    Returns:
+        str: The source code of the module.
+
+    """
+    writer = _Writer(scale, classes, rng)
+    lines = [writer.docstring(f"The {module} module.", 0), ""]
+    lines.append("from __future__ import annotations")
+
+    for c in range(scale.classes):
+        lines.extend(["", "", *writer.class_(c)])
+
+    for f in range(scale.classes):
+        lines.extend(["", "", *writer.function(f"function{f}", 0)])
+
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class _Writer:
+    scale: Scale
+    classes: list[str]
+    rng: random.Random
+
+    def docstring(self, summary: str, indent: int, sections: str = "") -> str:
+        refs = [self.rng.choice(self.classes) for _ in range(self.scale.refs)]
+        refs = [f"[{ref.rsplit('.', 1)[-1]}][{ref}]" for ref in refs]
+        body = [LOREM] * self.scale.doc_lines
+        if refs:
+            body.append("See also " + ", ".join(refs) + ".")
+
+        text = "\n".join([summary, "", *body])
+        if sections:
+            text = f"{text}\n\n{sections}"
+
+        text = f'"""{text}\n"""'
+        return textwrap.indent(text, " " * indent)
+
+    def class_(self, c: int) -> list[str]:
+        sections = (
+            "Args:\n    x (int): The value.\n\nAttributes:\n    x (int): The value."
+        )
+        lines = [f"class Class{c}:", self.docstring(f"Class {c}.", 4, sections), ""]
+        lines.extend(["    def __init__(self, x: int) -> None:", "        self.x = x"])
+
+        for m in range(self.scale.methods):
+            lines.extend(["", *self.function(f"method{m}", 4, is_method=True)])
+
+        return lines
+
+    def function(self, name: str, indent: int, *, is_method: bool = False) -> list[str]:
+        sections = (
+            "Args:\n    a (int): The first argument.\n    b (str): The second argument."
+            "\n\nReturns:\n    str: The result."
+        )
+        doc = self.docstring(f"Function {name}.", indent + 4, sections)
+        self_ = "self, " if is_method else ""
+        prefix = " " * indent
+        return [
+            f'{prefix}def {name}({self_}a: int, b: str = "") -> str:',
+            doc,
+            f"{prefix}    return b * a",
+        ]
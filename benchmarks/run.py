@@ -0,0 +1,275 @@
+"""Run benchmarks of MkAPI with synthetic packages.
+
+Generate a synthetic package for each scale point and measure the time
+and the peak memory of each stage:
+
+- `nav`: `mkapi.nav.update_nav` with page and object name registration
+- `generate`: `Page.generate_markdown` for all API pages
+- `convert`: `Page.convert_markdown` for all API pages
+- `html`: `Page.convert_html` for all API pages
+- `build`: a full `mkdocs build` with the MkAPI plugin
+
+Time is measured without tracing. Peak memory is measured in a second,
+separate run with `tracemalloc`, after all caches have been cleared.
+
+Run from the repository root:
+
+    python -m benchmarks.run --modules 10 50 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import markdown
+from astdoc.utils import cache_clear
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+import mkapi.renderer
+from mkapi.nav import is_package, update_nav
+from mkapi.page import URIS, Page
+
+from .generate import Scale, generate_package
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+PACKAGE = "mkapi_benchmark"
+
+STAGES = ("nav", "generate", "convert", "html", "build")
+
+EXTENSIONS = ["admonition", "attr_list", "md_in_html", "pymdownx.superfences", "toc"]
+
+MKDOCS_YML = f"""\
+site_name: MkAPI Benchmark
+theme: mkdocs
+nav:
+  - index.md
+  - API: $api:src/{PACKAGE}.***
+plugins:
+  - mkapi
+"""
+
+
+@dataclass
+class Result:
+    """Represent the result of a benchmark at a scale point."""
+
+    scale: Scale
+    """The size of the package."""
+
+    pages: int = 0
+    """The number of API pages."""
+
+    times: dict[str, float] = field(default_factory=dict)
+    """The time of each stage in seconds."""
+
+    peaks: dict[str, int] = field(default_factory=dict)
+    """The peak memory of each stage in bytes."""
+
+
+@contextmanager
+def measure(stage: str, result: Result, *, memory: bool) -> Iterator[None]:
+    """Measure the time or the peak memory of a stage.
+
+    Args:
+        stage (str): The name of the stage.
+        result (Result): The result to store the measurement in.
+        memory (bool): Whether to measure the peak memory instead of the time.
+
+    """
+    if memory:
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        yield
+        result.peaks[stage] = tracemalloc.get_traced_memory()[1] - start
+        return
+
+    start_time = time.perf_counter()
+    yield
+    result.times[stage] = time.perf_counter() - start_time
+
+
+def create_pages() -> dict[str, Page]:
+    """Register the API pages of the benchmark package as the plugin does.
+
+    Returns:
+        dict[str, Page]: The pages keyed by source URI.
+
+    """
+    pages: dict[str, Page] = {}
+
+    def create_page(name: str, path: str) -> str:
+        object_path, source_path = path.split(":", maxsplit=1)
+        uri = name.replace(".", "/")
+        suffix = "/README.md" if is_package(name) else ".md"
+        object_uri = f"{object_path}/{uri}{suffix}"
+        pages[object_uri] = Page.create_object(object_uri, name)
+        source_uri = f"{source_path}/{uri}.md"
+        pages[source_uri] = Page.create_source(source_uri, name)
+        return object_uri
+
+    nav = [{"API": f"$api:src/{PACKAGE}.***"}]
+    update_nav(nav, create_page)
+    return pages
+
+
+def run_stages(root: Path, result: Result, *, memory: bool) -> None:
+    """Run the stages of a benchmark once.
+
+    Args:
+        root (Path): The directory of the benchmark project.
+        result (Result): The result to store the measurements in.
+        memory (bool): Whether to measure the peak memory instead of the time.
+
+    """
+    cache_clear()
+    URIS.clear()
+    mkapi.renderer.load_templates()
+
+    with measure("nav", result, memory=memory):
+        pages = create_pages()
+        for page in pages.values():
+            page.register()
+
+    result.pages = len(pages)
+
+    with measure("generate", result, memory=memory):
+        for page in pages.values():
+            page.generate_markdown()
+
+    with measure("convert", result, memory=memory):
+        markdowns = {uri: page.convert_markdown("") for uri, page in pages.items()}
+
+    htmls = {}
+    for uri, markdown_ in markdowns.items():
+        htmls[uri] = markdown.markdown(markdown_, extensions=EXTENSIONS)
+
+    with measure("html", result, memory=memory):
+        for uri, page in pages.items():
+            page.convert_html(htmls[uri])
+
+    cache_clear()
+    URIS.clear()
+
+    config = load_config(str(root / "mkdocs.yml"), site_dir=str(root / "site"))
+    with measure("build", result, memory=memory):
+        build(config)
+
+
+def run(scale: Scale, *, memory: bool = True) -> Result:
+    """Run a benchmark at a scale point.
+
+    Args:
+        scale (Scale): The size of the package.
+        memory (bool): Whether to measure the peak memory as well.
+
+    Returns:
+        Result: The time and the peak memory of each stage.
+
+    """
+    result = Result(scale)
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        generate_package(root / "src", PACKAGE, scale)
+        (root / "docs").mkdir()
+        (root / "docs" / "index.md").write_text("# MkAPI Benchmark\n")
+        (root / "mkdocs.yml").write_text(MKDOCS_YML)
+
+        sys.path.insert(0, str(root / "src"))
+        try:
+            run_stages(root, result, memory=False)
+
+            if memory:
+                tracemalloc.start()
+                try:
+                    run_stages(root, result, memory=True)
+                finally:
+                    tracemalloc.stop()
+        finally:
+            sys.path.remove(str(root / "src"))
+            _unload(PACKAGE)
+            cache_clear()
+            URIS.clear()
+
+    return result
+
+
+def _unload(package: str) -> None:
+    for name in list(sys.modules):
+        if name == package or name.startswith(f"{package}."):
+            del sys.modules[name]
+
+
+def format_results(results: list[Result]) -> str:
+    """Return a table of the benchmark results.
+
+    Args:
+        results (list[Result]): The results to format.
+
+    Returns:
+        str: The table with the time in seconds and the peak memory in MiB
+        of each stage for each scale point.
+
+    """
+    header = ["modules", "pages", *(f"{s} [s]" for s in STAGES)]
+    header.extend(f"{s} [MiB]" for s in STAGES)
+    rows = [header]
+
+    for result in results:
+        row = [str(result.scale.modules), str(result.pages)]
+        row.extend(f"{result.times.get(s, 0):.3f}" for s in STAGES)
+        row.extend(f"{result.peaks.get(s, 0) / 2**20:.1f}" for s in STAGES)
+        rows.append(row)
+
+    widths = [max(len(row[k]) for row in rows) for k in range(len(header))]
+    lines = [
+        "  ".join(x.rjust(w) for x, w in zip(row, widths, strict=True)) for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None, write: Callable[[str], object] = print) -> None:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv (list[str] | None): The command line arguments.
+        write (Callable[[str], object]): The function to write the output.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--modules", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--classes", type=int, default=Scale.classes)
+    parser.add_argument("--methods", type=int, default=Scale.methods)
+    parser.add_argument("--doc-lines", type=int, default=Scale.doc_lines)
+    parser.add_argument("--refs", type=int, default=Scale.refs)
+    parser.add_argument("--no-memory", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("mkdocs").setLevel(logging.ERROR)
+
+    base = Scale(0, args.classes, args.methods, args.doc_lines, args.refs)
+    results = []
+
+    for modules in args.modules:
+        scale = replace(base, modules=modules)
+        write(f"Running benchmark: {scale}")
+        results.append(run(scale, memory=not args.no_memory))
+
+    write(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
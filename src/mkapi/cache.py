@@ -0,0 +1,216 @@
+"""Persistent cache of rendered markdown for API objects.
+
+Store the markdown rendered for each `::: name` line in a content-addressed
+directory. The key combines the page, the object line, the source hash of the
+module that defines the object, the MkAPI version, and the template hash.
+Each entry also stores the source hashes of the modules read to render it,
+so an entry is reused only while none of them has changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import Counter
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from astdoc.utils import cache, get_module_path
+
+import mkapi.graph
+import mkapi.renderer
+from mkapi.config import get_config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+counts: Counter[str] = Counter()
+"""The number of cache hits and misses."""
+
+
+def get_cache_dir() -> Path | None:
+    """Return the cache directory if the cache is enabled.
+
+    A relative directory is resolved against the directory of the MkDocs
+    configuration file.
+
+    Returns:
+        Path | None: The cache directory, or None if the cache is disabled.
+
+    """
+    config = get_config()
+    if not config.cache or not config.cache_dir:
+        return None
+
+    path = Path(config.cache_dir)
+    if not path.is_absolute() and config.config_file_path:
+        path = Path(config.config_file_path).parent / path
+
+    return path
+
+
+@cache
+def get_version() -> str:
+    """Return the installed version of MkAPI."""
+    try:
+        return version("mkapi")
+    except PackageNotFoundError:
+        return ""
+
+
+@cache
+def get_module_hash(module: str) -> str | None:
+    """Return the SHA-256 hash of the module source file.
+
+    Args:
+        module (str): The name of the module.
+
+    Returns:
+        str | None: The hex digest of the source file, or None if the module
+        has no source file.
+
+    """
+    if not (path := get_module_path(module)):
+        return None
+
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@cache
+def get_templates_hash() -> str:
+    """Return the hash of the currently loaded templates."""
+    digest = hashlib.sha256()
+
+    for name, template in sorted(mkapi.renderer.templates.items()):
+        digest.update(name.encode())
+        if template.filename:
+            digest.update(Path(template.filename).read_bytes())
+
+    return digest.hexdigest()
+
+
+def get_module_name(name: str, module: str | None = None) -> str | None:
+    """Return the name of the module whose source defines the object.
+
+    Args:
+        name (str): The name of the object.
+        module (str | None): The module of the object, if known.
+
+    Returns:
+        str | None: The module name, or None if no module source is found.
+
+    Examples:
+        >>> get_module_name("mkapi.cache.get_key")
+        'mkapi.cache'
+        >>> get_module_name("Item", "astdoc.doc")
+        'astdoc.doc'
+
+    """
+    if module:
+        return module
+
+    return mkapi.graph.get_module_name(name)
+
+
+def get_key(
+    src_uri: str,
+    text: str,
+    name: str,
+    module: str | None,
+    lines: tuple[int, int] | None = None,
+) -> str | None:
+    """Return the cache key for an object line in a page.
+
+    Args:
+        src_uri (str): The source URI of the page being rendered.
+        text (str): The object line, e.g. `## ::: Item astdoc.doc`.
+        name (str): The name of the object.
+        module (str | None): The module of the object.
+        lines (tuple[int, int] | None): The lines of the module source
+            rendered in a split source page.
+
+    Returns:
+        str | None: The cache key, or None if the cache is disabled or the
+        object has no module source.
+
+    """
+    if not get_cache_dir():
+        return None
+
+    if not (module_ := get_module_name(name, module)):
+        return None
+
+    if not (module_hash := get_module_hash(module_)):
+        return None
+
+    parts = [src_uri, text, module_hash, get_version(), get_templates_hash()]
+    if lines:
+        parts.append(f"{lines[0]}-{lines[1]}")
+
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _get_path(key: str) -> Path | None:
+    if not (path := get_cache_dir()):
+        return None
+
+    return path / "markdown" / key[:2] / f"{key}.json"
+
+
+def load(key: str) -> tuple[str, list[str]] | None:
+    """Load the cached markdown for the key.
+
+    An entry is valid only while the modules read to render the markdown
+    have the same source as when the entry was saved.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        tuple[str, list[str]] | None: The cached markdown and the modules
+        read to render it, or None if there is no valid entry.
+
+    """
+    if not (path := _get_path(key)):
+        return None
+
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        counts["miss"] += 1
+        return None
+
+    modules: dict[str, str | None] = entry["modules"]
+    if any(get_module_hash(module) != hash_ for module, hash_ in modules.items()):
+        counts["miss"] += 1
+        return None
+
+    counts["hit"] += 1
+    return entry["markdown"], list(modules)
+
+
+def save(key: str, markdown: str, modules: Iterable[str] = ()) -> None:
+    """Save the markdown for the key.
+
+    The source hashes of the modules are saved with the markdown.
+    The file is written to a temporary path first and then moved into place,
+    so that concurrent builds never read a partially written entry.
+
+    Args:
+        key (str): The cache key.
+        markdown (str): The rendered markdown.
+        modules (Iterable[str]): The modules read to render the markdown.
+
+    """
+    if not (path := _get_path(key)):
+        return
+
+    hashes = {module: get_module_hash(module) for module in sorted(modules)}
+    entry = {"markdown": markdown, "modules": hashes}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(entry), encoding="utf-8")
+    tmp.replace(path)
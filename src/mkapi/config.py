@@ -25,6 +25,13 @@ class Config(BaseConfig):
     search_exclude = config_options.Type(bool, default=False)
     source_search_exclude = config_options.Type(bool, default=True)
     save = config_options.Type(bool | str, default=False)
+    cache = config_options.Type(bool, default=False)
+    cache_dir = config_options.Type(str, default=".cache/plugin/mkapi")
+    workers = config_options.Type(int, default=0)
+    profile = config_options.Type(str, default="")
+    lazy_source = config_options.Type(bool, default=False)
+    source_max_lines = config_options.Type(int, default=0)
+    native_render = config_options.Type(bool, default=True)
 
 
 _config: Config = Config()  # type: ignore
@@ -0,0 +1,242 @@
+"""Dependency graph between API pages and the modules they read.
+
+Record, while a page is rendered, every module whose source was used:
+the modules of rendered objects and summary items, the modules of base
+classes, and the modules of resolved names. The graph is used to decide
+whether a generated page has to be rebuilt.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from astdoc.utils import cache, get_module_path, iter_attribute_names
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+DEPENDENCIES: dict[str, set[str]] = {}
+"""The module names read by each page, keyed by the source URI of the page."""
+
+MTIMES: dict[Path, tuple[str, float]] = {}
+"""The module name and the modification time of each module file read in the
+last build, keyed by the path."""
+
+LISTINGS: dict[Path, set[str]] = {}
+"""The module files and subdirectories of each package directory read in the
+last build, keyed by the path."""
+
+_stack: list[tuple[str, set[str]]] = []
+
+
+@cache
+def get_module_name(name: str) -> str | None:
+    """Return the name of the module with a source file that contains the name.
+
+    Args:
+        name (str): The fully qualified name of a module or an object.
+
+    Returns:
+        str | None: The longest module prefix of the name that has a
+        source file, or None if there is no such module.
+
+    Examples:
+        >>> get_module_name("mkapi.graph.record")
+        'mkapi.graph'
+        >>> get_module_name("mkapi")
+        'mkapi'
+        >>> get_module_name("invalid") is None
+        True
+
+    """
+    found = None
+    for name_ in iter_attribute_names(name):
+        if get_module_path(name_):
+            found = name_
+
+    return found
+
+
+def record(name: str | None) -> None:
+    """Record that the current page reads the module of the name.
+
+    Do nothing if no page is being recorded.
+
+    Args:
+        name (str | None): The fully qualified name of a module or an object.
+
+    """
+    if not _stack or not name:
+        return
+
+    if module := get_module_name(name):
+        _stack[-1][1].add(module)
+
+
+def record_modules(modules: Iterable[str]) -> None:
+    """Record that the current page reads the modules."""
+    if _stack:
+        _stack[-1][1].update(modules)
+
+
+@contextmanager
+def recording(src_uri: str) -> Iterator[set[str]]:
+    """Record the modules read while rendering a page.
+
+    Args:
+        src_uri (str): The source URI of the page.
+
+    Yields:
+        set[str]: The set of module names, which is filled while the
+        context is active and stored in `DEPENDENCIES` on exit.
+
+    """
+    modules: set[str] = set()
+    _stack.append((src_uri, modules))
+
+    try:
+        yield modules
+    finally:
+        _stack.pop()
+        DEPENDENCIES[src_uri] = modules
+
+
+@contextmanager
+def capture() -> Iterator[set[str]]:
+    """Capture the modules recorded within the context.
+
+    The captured modules are also recorded to the enclosing context, if any.
+    Used to remember the dependencies of a cached result, so that they can be
+    recorded again with `record_modules` when the result is reused.
+
+    Yields:
+        set[str]: The set of module names, which is filled while the
+        context is active.
+
+    """
+    modules: set[str] = set()
+    _stack.append(("", modules))
+
+    try:
+        yield modules
+    finally:
+        _stack.pop()
+        record_modules(modules)
+
+
+def update(src_uri: str, modules: Iterable[str]) -> None:
+    """Set the dependencies of a page recorded elsewhere."""
+    DEPENDENCIES[src_uri] = set(modules)
+
+
+def is_modified(src_uri: str, mtime: float) -> bool | None:
+    """Check if any module read by the page is newer than the given time.
+
+    Args:
+        src_uri (str): The source URI of the page.
+        mtime (float): The modification time of the built page.
+
+    Returns:
+        bool | None: True if a module was modified or removed after `mtime`,
+        False if not, or None if no dependencies are recorded for the page.
+
+    """
+    if not (modules := DEPENDENCIES.get(src_uri)):
+        return None
+
+    for module in modules:
+        if not (path := get_module_path(module)):
+            return True
+
+        if path.stat().st_mtime > mtime:
+            return True
+
+    return False
+
+
+def _list_directory(path: Path) -> set[str]:
+    try:
+        return {p.name for p in path.iterdir() if p.suffix == ".py" or p.is_dir()}
+    except OSError:
+        return set()
+
+
+def _get_mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def snapshot(modules: Iterable[str]) -> None:
+    """Record the modification time of the modules and their directories.
+
+    The listing of a directory is recorded as well, so that adding or
+    removing a module in a package is detected.
+
+    Args:
+        modules (Iterable[str]): The names of the modules read in the build.
+
+    """
+    MTIMES.clear()
+    LISTINGS.clear()
+
+    for module in modules:
+        if not (path := get_module_path(module)):
+            continue
+
+        if (mtime := _get_mtime(path)) is None:
+            continue
+
+        MTIMES[path] = module, mtime
+
+        if path.parent not in LISTINGS:
+            LISTINGS[path.parent] = _list_directory(path.parent)
+
+
+def get_modified_modules() -> set[str] | None:
+    """Return the modules modified or removed since the last snapshot.
+
+    Returns:
+        set[str] | None: The names of the modified modules, or None if no
+        snapshot has been taken or a module has been added to or removed
+        from a package directory.
+
+    """
+    if not MTIMES:
+        return None
+
+    for path, names in LISTINGS.items():
+        if _list_directory(path) != names:
+            return None
+
+    modules = set()
+    for path, (module, mtime) in MTIMES.items():
+        if (mtime_ := _get_mtime(path)) is None:
+            return None
+
+        if mtime_ != mtime:
+            modules.add(module)
+
+    return modules
+
+
+def load(path: Path) -> None:
+    """Load the dependency graph from a JSON file, if it exists."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+
+    for src_uri, modules in data.items():
+        DEPENDENCIES.setdefault(src_uri, set(modules))
+
+
+def save(path: Path) -> None:
+    """Save the dependency graph to a JSON file."""
+    data = {src_uri: sorted(modules) for src_uri, modules in DEPENDENCIES.items()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
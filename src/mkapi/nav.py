@@ -8,16 +8,217 @@ entries dynamically.
 
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from astdoc.utils import find_submodule_names, get_module_path, is_package
+from astdoc.utils import get_module_path
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterable
     from typing import Any
 
+    Node = tuple[str, "list[Node] | None"]
+    Submodule = tuple[str, str | None]
+
+_directories: dict[str, tuple[str, dict[str, float], list[Submodule]]] = {}
+"""The submodules of each scanned package directory, keyed by the directory.
+Each value holds the package name, the modification times of the directory
+and its subdirectories, and the submodule names with the directories of
+subpackages."""
+
+
+def get_package_tree(
+    name: str,
+    predicate: Callable[[str], bool] | None = None,
+    *,
+    recursive: bool = True,
+) -> list[Node] | None:
+    """Return the submodule tree of a package.
+
+    Scan each package directory with `os.scandir` and keep the result until
+    the directory or one of its subdirectories is modified. Each node of the
+    tree is a tuple of the submodule name and its children, which is None
+    for a module. The children are sorted as in
+    `astdoc.utils.find_submodule_names`: packages first, then modules.
+
+    Args:
+        name (str): The name of the package.
+        predicate (Callable[[str], bool] | None, optional): An optional
+            predicate function to filter submodule names. The directory of
+            a subpackage that does not satisfy the predicate is not scanned.
+        recursive (bool, optional): Whether to scan subpackages. If False,
+            the children of subpackages are empty lists. Defaults to True.
+
+    Returns:
+        list[Node] | None: The submodule tree of the package, or None if
+        the name is not a package with a source file.
+
+    """
+    if not is_package(name):
+        return None
+
+    path = str(get_module_path(name).parent)  # type: ignore
+    return _get_tree(name, path, predicate, recursive=recursive)
+
+
+def is_package(name: str) -> bool:
+    """Return True if the name is a package with a source file.
+
+    Use the cached module path that `get_package_tree` uses, instead of
+    `astdoc.utils.is_package` that finds the module spec at each call.
+
+    Args:
+        name (str): The name of the module.
+
+    Returns:
+        bool: True if the source file of the module is an `__init__.py`.
+
+    Examples:
+        >>> is_package("mkapi"), is_package("mkapi.nav"), is_package("invalid")
+        (True, False, False)
+
+    """
+    path = get_module_path(name)
+    return path is not None and path.name == "__init__.py"
+
+
+def _get_tree(
+    name: str,
+    path: str,
+    predicate: Callable[[str], bool] | None,
+    *,
+    recursive: bool,
+) -> list[Node]:
+    nodes: list[Node] = []
+
+    for subname, subpath in _scan(name, path):
+        if predicate and not predicate(subname):
+            continue
+
+        if subpath is None:
+            children = None
+        elif recursive:
+            children = _get_tree(subname, subpath, predicate, recursive=True)
+        else:
+            children = []
+
+        nodes.append((subname, children))
+
+    return nodes
+
+
+def _scan(name: str, path: str) -> list[Submodule]:
+    if (
+        (cached := _directories.get(path))
+        and cached[0] == name
+        and _is_fresh(cached[1])
+    ):
+        return cached[2]
+
+    mtimes = {path: os.stat(path).st_mtime}  # noqa: PTH116
+    names: list[Submodule] = []
+
+    with os.scandir(path) as it:
+        for entry in it:
+            fullname = f"{name}.{entry.name.removesuffix('.py')}"
+            if entry.is_dir():
+                mtimes[entry.path] = entry.stat().st_mtime
+                if os.path.isfile(os.path.join(entry.path, "__init__.py")):  # noqa: PTH113, PTH118
+                    names.append((fullname, entry.path))
+
+            elif entry.name.endswith(".py") and not entry.name.startswith("__"):
+                names.append((fullname, None))
+
+    names.sort(key=lambda x: (x[1] is None, x[0].replace("_", "~")))
+    _directories[path] = (name, mtimes, names)
+    return names
+
+
+def _is_fresh(mtimes: dict[str, float]) -> bool:
+    return all(_get_mtime(path) == mtime for path, mtime in mtimes.items())
+
+
+def _get_mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime  # noqa: PTH116
+    except OSError:
+        return None
+
+
+def scan_packages(
+    packages: Iterable[tuple[str, int]],
+    predicate: Callable[[str], bool] | None = None,
+) -> list[str]:
+    """Scan the submodule trees of packages concurrently.
+
+    The scanned directories are kept for `get_package_tree`, so that the
+    navigation of independent API entries is built without walking the
+    file system again. The subpackages of a package listed only with
+    depth 1 are not scanned, as `get_apinav` does not read them.
+
+    Args:
+        packages (Iterable[tuple[str, int]]): The names of the packages and
+            the depths of their navigation entries.
+        predicate (Callable[[str], bool] | None, optional): An optional
+            predicate function to filter submodule names. The directories
+            of excluded subpackages are not scanned.
+
+    Returns:
+        list[str]: The root directories of the scanned package trees, in
+        the order of the packages. Names that are not packages are skipped.
+
+    """
+    recursive: dict[str, bool] = {}
+    for name, depth in packages:
+        recursive[name] = recursive.get(name, False) or depth != 1
+
+    def scan(name: str) -> str | None:
+        if get_package_tree(name, predicate, recursive=recursive[name]) is None:
+            return None
+
+        return str(get_module_path(name).parent)  # type: ignore
+
+    if len(recursive) < 2:
+        paths = [scan(name) for name in recursive]
+    else:
+        with ThreadPoolExecutor() as executor:
+            paths = list(executor.map(scan, recursive))
+
+    return [path for path in paths if path]
+
+
+def compile_exclude(patterns: Iterable[str]) -> Callable[[str], bool]:
+    """Compile shell-style exclusion patterns into a single matcher.
+
+    Return a function that is equivalent to calling `fnmatch.fnmatch` with
+    each pattern, but matches a name against one combined regular expression.
+
+    Args:
+        patterns (Iterable[str]): The shell-style patterns of the names
+            to exclude.
+
+    Returns:
+        Callable[[str], bool]: A function that returns True if a name
+        matches any of the patterns.
+
+    Examples:
+        >>> is_excluded = compile_exclude(["a.b.*", "*.tests"])
+        >>> is_excluded("a.b.c"), is_excluded("x.tests"), is_excluded("a.c")
+        (True, True, False)
+        >>> compile_exclude([])("a")
+        False
+
+    """
+    patterns = [fnmatch.translate(os.path.normcase(p)) for p in patterns]
+    if not patterns:
+        return lambda _: False
+
+    match = re.compile("|".join(patterns)).match
+    return lambda name: match(os.path.normcase(name)) is not None
+
 
 def get_apinav(  # noqa: PLR0911
     name: str,
@@ -54,40 +255,39 @@ def get_apinav(  # noqa: PLR0911
             return [name]
         return []
 
-    if not is_package(name):
+    tree = get_package_tree(name, predicate, recursive=depth != 1)
+    if tree is None:
         return [name]
 
-    find = partial(find_submodule_names, predicate=predicate)
-
     if depth == 1:
-        return [name, *find(name)]
+        return [name, *(node[0] for node in tree)]
 
     if depth == 2:
-        return _get_apinav_list(name, find)
+        return _get_apinav_list(name, tree)
 
     if depth == 3:
-        return [_get_apinav_dict(name, find)]
+        return [_get_apinav_dict(name, tree)]
 
     return [name]
 
 
-def _get_apinav_list(name: str, find: Callable[[str], list[str]]) -> list[str]:
+def _get_apinav_list(name: str, nodes: list[Node]) -> list[str]:
     names = [name]
-    for subname in find(name):
-        if is_package(subname):
-            names.extend(_get_apinav_list(subname, find))
-        else:
+    for subname, children in nodes:
+        if children is None:
             names.append(subname)
+        else:
+            names.extend(_get_apinav_list(subname, children))
     return names
 
 
-def _get_apinav_dict(name: str, find: Callable[[str], list[str]]) -> dict[str, list]:
+def _get_apinav_dict(name: str, nodes: list[Node]) -> dict[str, list]:
     names: list[str | dict] = [name]
-    for subname in find(name):
-        if is_package(subname):
-            names.append(_get_apinav_dict(subname, find))
-        else:
+    for subname, children in nodes:
+        if children is None:
             names.append(subname)
+        else:
+            names.append(_get_apinav_dict(subname, children))
     return {name: names}
 
 
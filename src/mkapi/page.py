@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import os.path
 import re
-from dataclasses import dataclass
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import partial
-from pathlib import PurePath
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 import astdoc.markdown
-from astdoc.node import get_module_members
-from astdoc.utils import get_module_node
+from astdoc.node import Definition, get_module_members
+from astdoc.object import Module, get_object
+from astdoc.utils import cache, get_module_node, get_module_path
 
+import mkapi.cache
+import mkapi.graph
 import mkapi.renderer
 from mkapi.renderer import TemplateKind
 
@@ -32,16 +37,29 @@ class PageKind(Enum):
 
 
 URIS: dict[str, dict[str, str]] = {}
+"""The source URI of the page of each object name, keyed by the namespace
+(`object` or `source`)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
-    """Page class."""
+    """Page class.
+
+    The markdown generated for an API page is released once the page has been
+    converted, and is generated again if the page is converted again.
+    """
 
     src_uri: str
     name: str
     markdown: str
     kind: PageKind
+    rendered: str | None = field(default=None, repr=False)
+    lines: tuple[int, int] | None = None
+    chunk_uris: list[str] = field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        self.src_uri = sys.intern(self.src_uri)
+        self.name = sys.intern(self.name)
 
     @classmethod
     def create_object(cls, src_uri: str, name: str) -> Page:
@@ -49,12 +67,17 @@ class Page:
         return cls(src_uri, name, "", PageKind.OBJECT)
 
     @classmethod
-    def create_source(cls, src_uri: str, name: str) -> Page:
-        """Create a source page."""
-        return cls(src_uri, name, "", PageKind.SOURCE)
+    def create_source(
+        cls,
+        src_uri: str,
+        name: str,
+        lines: tuple[int, int] | None = None,
+    ) -> Page:
+        """Create a source page, optionally for the given lines of the module."""
+        return cls(src_uri, name, "", PageKind.SOURCE, lines=lines)
 
     @classmethod
-    def create_documentation(cls, src_uri: str, content: str) -> Page:
+    def create_documentation(cls, src_uri: str, content: str = "") -> Page:
         """Create a documentation page."""
         return cls(src_uri, "", content, PageKind.DOCUMENTATION)
 
@@ -79,36 +102,100 @@ class Page:
 
     def generate_markdown(self) -> None:
         """Generate markdown for the page."""
-        self.markdown, names = generate_module_markdown(self.name)
+        self.markdown = self.create_markdown()
+
+    def create_markdown(self) -> str:
+        """Return the markdown for the page.
+
+        A source page split into several pages lists only the objects defined
+        in its lines, followed by the links to the other pages.
+        """
+        markdown, _ = generate_module_markdown(self.name, self.lines)
+
+        if self.chunk_uris:
+            markdown = f"{markdown}\n\n{_get_chunk_links(self)}"
+
+        return markdown
+
+    def get_names(self) -> list[str]:
+        """Return the object names rendered in the page.
+
+        The names are listed from the member index of the module, without
+        generating the markdown.
+        """
+        return get_module_names(self.name, self.lines)
+
+    def register(self) -> None:
+        """Register the object names rendered in the page."""
         namespace = "source" if self.is_source_page() else "object"
         uris = URIS.setdefault(namespace, {})
 
-        for name in names:
+        for name in self.get_names():
             uris[name] = self.src_uri
 
-    def convert_markdown(self, markdown: str) -> str:
-        """Convert markdown for the page."""
-        if self.is_api_page():
-            markdown = self.markdown
+    def _get_namespaces(self) -> tuple[str, str]:
+        if self.is_source_page():
+            return ("source", "object")
+
+        return ("object", "source")
+
+    def _predicate(self, parser: Parser, kind: TemplateKind) -> bool:
+        if kind == TemplateKind.HEADING:
+            return True
+
+        if kind == TemplateKind.OBJECT and parser.name == self.name:
+            return True
 
         if self.is_source_page():
-            namespaces = ("source", "object")
-        else:
-            namespaces = ("object", "source")
+            return bool(kind == TemplateKind.SOURCE and self.name == parser.name)
 
-        def predicate(parser: Parser, kind: TemplateKind) -> bool:
-            if kind == TemplateKind.HEADING:
-                return True
+        return kind != TemplateKind.SOURCE
 
-            if kind == TemplateKind.OBJECT and parser.name == self.name:
-                return True
+    def render_markdown(self) -> None:
+        """Render the objects in the page markdown in advance.
 
-            if self.is_source_page():
-                return bool(kind == TemplateKind.SOURCE and self.name == parser.name)
+        The rendered markdown is kept until the next call of `convert_markdown`,
+        which then only resolves the links.
+        """
+        namespace = self._get_namespaces()[1]
 
-            return kind != TemplateKind.SOURCE
+        with mkapi.graph.recording(self.src_uri):
+            self.rendered = render_markdown(
+                self.markdown,
+                self.src_uri,
+                namespace,
+                self._predicate,
+                self.lines,
+            )
 
-        return convert_markdown(markdown, self.src_uri, namespaces, predicate)
+    def convert_markdown(self, markdown: str) -> str:
+        """Convert markdown for the page."""
+        namespaces = self._get_namespaces()
+
+        if self.rendered is not None:
+            markdown, self.rendered, self.markdown = self.rendered, None, ""
+            return link_markdown(markdown, self.src_uri, namespaces[0])
+
+        if self.is_documentation_page():
+            with mkapi.graph.recording(self.src_uri):
+                return convert_markdown(
+                    markdown,
+                    self.src_uri,
+                    namespaces,
+                    self._predicate,
+                )
+
+        markdown = self.markdown or self.create_markdown()
+        self.markdown = ""
+
+        with mkapi.graph.recording(self.src_uri):
+            return convert_markdown(
+                markdown,
+                self.src_uri,
+                namespaces,
+                self._predicate,
+                self.lines,
+            )
 
     def convert_html(self, html: str) -> str:
         """Return converted html."""
@@ -116,9 +203,68 @@ class Page:
         return convert_html(html, self.src_uri, namespace)
 
 
-def generate_module_markdown(module: str) -> tuple[str, list[str]]:
-    """Create module page."""
+@cache
+def get_member_index(module: str) -> list[tuple[str, int | None]] | None:
+    """Return the public members of a module and the lines of their definitions.
+
+    Args:
+        module (str): The name of the module.
+
+    Returns:
+        list[tuple[str, int | None]] | None: The qualified names of the members
+        and the line numbers of those defined in the module, or None if the
+        module is not found.
+
+    """
     if not get_module_node(module):
+        return None
+
+    members = get_module_members(module, private=False, special=False)
+    return [(name, _get_lineno(obj, module)) for name, obj in members]
+
+
+def _get_lineno(obj: object, module: str) -> int | None:
+    if isinstance(obj, Definition) and obj.module == module:
+        return obj.node.lineno
+
+    return None
+
+
+def get_module_names(module: str, lines: tuple[int, int] | None = None) -> list[str]:
+    """Return the object names rendered in the page of a module.
+
+    The names are the same as those returned by `generate_module_markdown`.
+    """
+    if (members := get_member_index(module)) is None:
+        if "." in module:
+            module, name = module.rsplit(".", 1)
+            return get_object_names(name, module)
+
+        return []
+
+    names = [module] if not lines or lines[0] == 1 else []
+    names.extend(f"{module}.{name}" for name in _filter_lines(members, lines))
+    return names
+
+
+def get_object_names(name: str, module: str) -> list[str]:
+    """Return the object names rendered in the page of an object.
+
+    The names are the same as those returned by `generate_object_markdown`.
+    """
+    return [f"{module}.{name_}" for name_ in _filter_name(module, name)]
+
+
+def generate_module_markdown(
+    module: str,
+    lines: tuple[int, int] | None = None,
+) -> tuple[str, list[str]]:
+    """Create module page.
+
+    If `lines` is given, only the members defined in the lines are listed.
+    Members defined in other modules are listed in the page of the first line.
+    """
+    if (members := get_member_index(module)) is None:
         if "." in module:
             module, name = module.rsplit(".", 1)
             return generate_object_markdown(name, module)
@@ -126,9 +272,9 @@ def generate_module_markdown(module: str) -> tuple[str, list[str]]:
         return f"!!! failure\n\n    module {module!r} not found.\n", []
 
     markdowns = [f"# ::: {module}"]
-    names = [module]
+    names = [module] if not lines or lines[0] == 1 else []
 
-    for name, _ in get_module_members(module, private=False, special=False):
+    for name in _filter_lines(members, lines):
         level = name.count(".") + 2
         markdown = f"{'#' * level} ::: {name} {module}"
         markdowns.append(markdown)
@@ -137,20 +283,94 @@ def generate_module_markdown(module: str) -> tuple[str, list[str]]:
     return "\n".join(markdowns), names
 
 
+def _filter_lines(
+    members: list[tuple[str, int | None]],
+    lines: tuple[int, int] | None,
+) -> list[str]:
+    if not lines:
+        return [name for name, _ in members]
+
+    return [name for name, lineno in members if _is_in_lines(lineno, lines)]
+
+
+def _is_in_lines(lineno: int | None, lines: tuple[int, int]) -> bool:
+    if lineno is not None:
+        return lines[0] <= lineno <= lines[1]
+
+    return lines[0] == 1
+
+
+@cache
+def get_source_chunks(module: str, size: int) -> list[tuple[int, int]]:
+    """Return the lines of each page of a source page split by size.
+
+    Args:
+        module (str): The name of the module.
+        size (int): The maximum number of lines of a page.
+
+    Returns:
+        list[tuple[int, int]]: The first and last lines of each page, or
+        an empty list if the source page of the module is not split.
+
+    """
+    if size <= 0 or not (path := get_module_path(module)):
+        return []
+
+    try:
+        if path.read_bytes().count(b"\n") <= size:
+            return []
+    except OSError:
+        return []
+
+    if not isinstance(obj := get_object(module), Module):
+        return []
+
+    chunks = mkapi.renderer.split_source(obj, size)
+    return chunks if len(chunks) > 1 else []
+
+
+def get_chunk_uri(src_uri: str, index: int) -> str:
+    """Return the source URI of a page of a split source page.
+
+    Examples:
+        >>> get_chunk_uri("src/a/b.md", 0)
+        'src/a/b.md'
+        >>> get_chunk_uri("src/a/b.md", 2)
+        'src/a/b/3.md'
+
+    """
+    if index == 0:
+        return src_uri
+
+    return f"{src_uri[:-3]}/{index + 1}.md"
+
+
+def _get_chunk_links(page: Page) -> str:
+    directory = page.src_uri.rpartition("/")[0] or "."
+    links = []
+
+    for k, uri in enumerate(page.chunk_uris, 1):
+        if uri == page.src_uri:
+            links.append(f"**{k}**")
+        else:
+            links.append(f"[{k}]({_get_relative_uri(uri, directory)})")
+
+    return f"Source pages : {' '.join(links)}"
+
+
 def generate_object_markdown(name: str, module: str) -> tuple[str, list[str]]:
     """Create object page."""
-    if not get_module_node(module):
+    if get_member_index(module) is None:
         return f"!!! failure\n\n    module {module!r} not found.\n", []
 
     markdowns = []
     names = []
 
-    for name_, _ in get_module_members(module, private=False, special=False):
-        if name_ == name or name_.startswith(f"{name}."):
-            level = name_.count(".") + 1
-            markdown = f"{'#' * level} ::: {name_} {module}"
-            markdowns.append(markdown)
-            names.append(f"{module}.{name_}")
+    for name_ in _filter_name(module, name):
+        level = name_.count(".") + 1
+        markdown = f"{'#' * level} ::: {name_} {module}"
+        markdowns.append(markdown)
+        names.append(f"{module}.{name_}")
 
     if markdowns:
         return "\n".join(markdowns), names
@@ -159,8 +379,43 @@ def generate_object_markdown(name: str, module: str) -> tuple[str, list[str]]:
     return m, []
 
 
-OBJECT_PATTERN = re.compile(r"^(#*) *?::: (.+?)$", re.MULTILINE)
-LINK_PATTERN = re.compile(r"(?<!`)\[([^[\]\s]+?)\]\[([^[\]\s]*?)\]")
+def _filter_name(module: str, name: str) -> list[str]:
+    # The object and its members sort from `name` up to `name/`, because
+    # no character of an identifier sorts before "/". They are returned in
+    # the order of the module members.
+    members = get_member_index(module) or []
+    index = _get_sorted_index(module)
+    lo = bisect_left(index, name, key=itemgetter(0))
+    hi = bisect_left(index, f"{name}/", lo, key=itemgetter(0))
+    return [members[k][0] for k in sorted(k for _, k in index[lo:hi])]
+
+
+@cache
+def _get_sorted_index(module: str) -> list[tuple[str, int]]:
+    members = get_member_index(module) or []
+    return sorted((name, k) for k, (name, _) in enumerate(members))
+
+
+OBJECT_PATTERN = re.compile(r"^(?P<heading>#*) *?::: (?P<object>.+?)$", re.MULTILINE)
+LINK_PATTERN = re.compile(r"(?<!`)\[(?P<name>[^[\]\s]+?)\]\[(?P<ref>[^[\]\s]*?)\]")
+CONVERT_PATTERN = re.compile(
+    f"{OBJECT_PATTERN.pattern}|{LINK_PATTERN.pattern}",
+    re.MULTILINE,
+)
+
+
+def has_markup(markdown: str) -> bool:
+    """Return True if the markdown may contain object lines or links.
+
+    Object lines contain `:::` and links contain `][`, so that markdown
+    without them is not scanned by `convert_markdown`.
+
+    Examples:
+        >>> has_markup("## ::: a.b"), has_markup("[a][a.b]"), has_markup("[a]")
+        (True, True, False)
+
+    """
+    return ":::" in markdown or "][" in markdown
 
 
 def convert_markdown(
@@ -168,29 +423,91 @@ def convert_markdown(
     src_uri: str,
     namespaces: tuple[str, str],
     predicate: Callable[[Parser, TemplateKind], bool] | None = None,
+    lines: tuple[int, int] | None = None,
 ) -> str:
-    """Return converted markdown."""
-    render = partial(_render, namespace=namespaces[1], predicate=predicate)
-    markdown = astdoc.markdown.sub(OBJECT_PATTERN, render, markdown)
+    """Return converted markdown.
+
+    Object lines and links are found in a single scan of the markdown.
+    Only the markdown rendered for each object is scanned again for its
+    links, so that the text outside of object lines is not scanned twice.
+    The result is the same as that of `render_markdown` followed by
+    `link_markdown`. Markdown without any object line or link is returned
+    as it is.
+    """
+    if not has_markup(markdown):
+        return markdown
 
+    render = partial(
+        _render,
+        src_uri=src_uri,
+        namespace=namespaces[1],
+        predicate=predicate,
+        lines=lines,
+    )
     link = partial(_link, src_uri=src_uri, namespace=namespaces[0])
+
+    def convert(match: re.Match) -> str:
+        if match.group("object") is None:
+            return link(match)
+
+        return link_markdown(render(match), src_uri, namespaces[0])
+
+    return astdoc.markdown.sub(CONVERT_PATTERN, convert, markdown)
+
+
+def render_markdown(
+    markdown: str,
+    src_uri: str,
+    namespace: str,
+    predicate: Callable[[Parser, TemplateKind], bool] | None = None,
+    lines: tuple[int, int] | None = None,
+) -> str:
+    """Return markdown with the object lines rendered."""
+    render = partial(
+        _render,
+        src_uri=src_uri,
+        namespace=namespace,
+        predicate=predicate,
+        lines=lines,
+    )
+    return astdoc.markdown.sub(OBJECT_PATTERN, render, markdown)
+
+
+def link_markdown(markdown: str, src_uri: str, namespace: str) -> str:
+    """Return markdown with the links resolved."""
+    link = partial(_link, src_uri=src_uri, namespace=namespace)
     return astdoc.markdown.sub(LINK_PATTERN, link, markdown)
 
 
 def _render(
     match: re.Match,
+    src_uri: str,
     namespace: str,
     predicate: Callable[[Parser, TemplateKind], bool] | None = None,
+    lines: tuple[int, int] | None = None,
 ) -> str:
-    heading, name = match.groups()
+    heading, name = match.group("heading", "object")
 
     if " " in name:
         name, module = name.split(" ", 1)
     else:
         module = None
 
+    key = mkapi.cache.get_key(src_uri, match.group(0), name, module, lines)
+    if key and (entry := mkapi.cache.load(key)) is not None:
+        markdown, modules = entry
+        mkapi.graph.record_modules(modules)
+        return markdown
+
     level = len(heading)
-    if markdown := mkapi.renderer.render(name, module, level, namespace, predicate):
+    args = (name, module, level, namespace, predicate)
+    with mkapi.graph.capture() as modules:
+        markdown = mkapi.renderer.render(*args, lines=lines)
+
+    if markdown:
+        if key:
+            mkapi.cache.save(key, markdown, modules)
+
         return markdown
 
     return match.group(0)
@@ -210,7 +527,7 @@ ANCHOR_TITLES = {
 
 
 def _link(match: re.Match, src_uri: str, namespace: str) -> str:
-    name, fullname = match.groups()
+    name, fullname = match.group("name", "ref")
     if not fullname:
         fullname = name
         if name.startswith("`") and name.endswith("`"):
@@ -242,8 +559,7 @@ def _link(match: re.Match, src_uri: str, namespace: str) -> str:
         from_mkapi = False
 
     if namespace in URIS and (uri := URIS[namespace].get(fullname)):
-        uri = os.path.relpath(uri, PurePath(src_uri).parent)
-        uri = uri.replace("\\", "/")  # Normalize for Windows
+        uri = _get_relative_uri(uri, src_uri.rpartition("/")[0] or ".")
         if not title:
             title = ANCHOR_TITLES[namespace] if is_object_link else fullname
         return f'[{name}]({uri}#{fullname} "{title}")'
@@ -254,8 +570,30 @@ def _link(match: re.Match, src_uri: str, namespace: str) -> str:
     return asname
 
 
-SOURCE_LINK_PATTERN = re.compile(r"(<span[^<]+?)## __mkapi__\.(\S+?)(</span>)")
-HEADING_PATTERN = re.compile(r"<h(\d).+?mkapi-heading.+?>(.+?)</h\d>\n?")
+# The same pairs of a target page and a linking directory or page occur many
+# times in a site, so relative URIs are memoized. See `cache_clear`.
+@cache
+def _get_relative_uri(uri: str, directory: str) -> str:
+    uri = os.path.relpath(uri, directory)
+    return uri.replace("\\", "/")  # Normalize for Windows
+
+
+@cache
+def _get_source_link_uri(uri: str, src_uri: str) -> str:
+    uri = os.path.relpath(uri, src_uri)
+    uri = uri[:-3]  # Remove `.md`
+    return uri.replace("/README", "")  # Remove `/README`
+
+
+SOURCE_LINK_PATTERN = re.compile(
+    r"(?P<open><span[^<]+?)## __mkapi__\.(?P<name>\S+?)(?P<close></span>)",
+)
+HEADING_PATTERN = re.compile(
+    r"<h(?P<level>\d).+?mkapi-heading.+?>(?P<heading>.+?)</h\d>\n?",
+)
+MARKER_PATTERN = re.compile(
+    r"mkapi(?:_(?P<placeholder>object|source|definition)_mkapi|__\.|-heading)",
+)
 
 ANCHOR_TEXTS = {
     "object": "[docs]",
@@ -265,25 +603,74 @@ ANCHOR_TEXTS = {
 
 
 def convert_html(html: str, src_uri: str, namespace: str) -> str:
-    """Convert HTML for source pages."""
-    for name, anchor in ANCHOR_TEXTS.items():
-        html = html.replace(ANCHOR_PLACEHOLDERS[name], anchor)
+    """Convert HTML for source pages.
+
+    Anchor placeholders, source links, and headings are rewritten in a single
+    scan over the MkAPI markers in the HTML. HTML without any marker is
+    returned as it is.
+    """
+    if "mkapi" not in html:
+        return html
 
     link = partial(_link_source, src_uri=src_uri, namespace=namespace)
-    html = SOURCE_LINK_PATTERN.sub(link, html)
+    parts = []
+    cursor = 0
+
+    for marker in MARKER_PATTERN.finditer(html):
+        start = marker.start()
+        if start < cursor:
+            continue
+
+        if name := marker.group("placeholder"):
+            parts.extend([html[cursor:start], ANCHOR_TEXTS[name]])
+            cursor = marker.end()
+            continue
+
+        if html.endswith("__.", 0, marker.end()):
+            match = _match_source_link(html, cursor, start)
+            replace = link
+        else:
+            match = _match_heading(html, cursor, start)
+            replace = partial(_heading, src_uri=src_uri, namespace=namespace)
+
+        if match:
+            parts.extend([html[cursor : match.start()], replace(match)])
+            cursor = match.end()
+
+    parts.append(html[cursor:])
+    return "".join(parts)
+
+
+def _match_source_link(html: str, pos: int, marker: int) -> re.Match | None:
+    if not html.startswith("## __", marker - 5):
+        return None
+
+    if (start := html.rfind("<", pos, marker)) == -1:
+        return None
 
-    return HEADING_PATTERN.sub(_heading, html)
+    if match := SOURCE_LINK_PATTERN.match(html, start):
+        return match if match.end("open") == marker - 5 else None
+
+    return None
+
+
+def _match_heading(html: str, pos: int, marker: int) -> re.Match | None:
+    start = max(html.rfind("\n", pos, marker) + 1, pos)
+    if (end := html.find("\n", marker)) == -1:
+        end = len(html)
+
+    if match := HEADING_PATTERN.search(html, start, end + 1):
+        return match if match.start() < marker < match.end() else None
+
+    return None
 
 
 def _link_source(match: re.Match, src_uri: str, namespace: str) -> str:
     anchor = ANCHOR_TEXTS[namespace]
-    open_tag, name, close_tag = match.groups()
+    open_tag, name, close_tag = match.group("open", "name", "close")
 
     if uri := URIS[namespace].get(name):
-        uri = os.path.relpath(uri, src_uri)
-        uri = uri[:-3]  # Remove `.md`
-        uri = uri.replace("/README", "")  # Remove `/README`
-
+        uri = _get_source_link_uri(uri, src_uri)
         href = f"{uri}/#{name}"
         title = ANCHOR_TITLES[namespace]
         link = f'<a href="{href}" title="{title}">{anchor}</a>'
@@ -298,9 +685,9 @@ def _link_source(match: re.Match, src_uri: str, namespace: str) -> str:
     return f"{open_tag}{close_tag}{link}"
 
 
-def _heading(match: re.Match) -> str:
-    if match.group(1) == "1":
-        name = match.group(2)
+def _heading(match: re.Match, src_uri: str, namespace: str) -> str:
+    if match.group("level") == "1":
+        name = convert_html(match.group("heading"), src_uri, namespace)
         return f'<h1 style="display: none;">{name}</h1>'
 
     return ""
@@ -9,13 +9,15 @@ to generate comprehensive documentation.
 from __future__ import annotations
 
 import ast
+import functools
 import re
 import sys
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from inspect import _ParameterKind as P
-from typing import TYPE_CHECKING, TypeAlias
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
 
 import astdoc.ast
 import astdoc.markdown
@@ -23,10 +25,8 @@ import astdoc.object
 from astdoc.doc import Doc, Item, Section
 from astdoc.node import (
     get_fullname_from_module,
-    iter_classes_from_module,
-    iter_functions_from_module,
+    get_module_members,
     iter_methods_from_class,
-    iter_modules_from_module,
 )
 from astdoc.object import (
     Attribute,
@@ -39,22 +39,47 @@ from astdoc.object import (
     get_object,
 )
 from astdoc.utils import (
+    cache,
     find_item_by_name,
-    find_submodule_names,
     is_enum,
     is_identifier,
-    is_package,
     iter_attribute_names,
     iter_identifiers,
     split_module_name,
 )
 
+import mkapi.graph
+import mkapi.nav
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from astdoc.ast import Parameter
 
 
+T = TypeVar("T")
+
+
+def _memoize(method: Callable[[Parser], T]) -> Callable[[Parser], T]:
+    """Memoize a parse method together with the modules it reads."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: Parser) -> T:
+        if name in self._results:
+            result, modules = self._results[name]
+            mkapi.graph.record_modules(modules)
+            return result
+
+        with mkapi.graph.capture() as modules:
+            result = method(self)
+
+        self._results[name] = result, modules
+        return result
+
+    return wrapper
+
+
 @dataclass
 class NameSet:
     """Represent a name set."""
@@ -90,10 +115,21 @@ class Parser:
     obj: Attribute | Class | Function | Module | Property
     """The object to parse."""
 
+    _results: dict[str, tuple[Any, set[str]]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
     @classmethod
     def create(cls, name: str, module: str | None = None) -> Parser | None:
         """Create a `Parser` instance from a given name.
 
+        Parsers are kept in a bounded LRU cache, so that the same object
+        is parsed only once while it is rendered and summarized in several
+        places. See `get_cache_info` and `clear_cache`.
+
         Args:
             name (str): The name of the object to parse.
             module (str | None): The module of the object to parse.
@@ -103,6 +139,27 @@ class Parser:
             otherwise None.
 
         """
+        key = (name, module)
+
+        if key in _parsers:
+            _parsers.move_to_end(key)
+            _cache_info.hits += 1
+            parser = _parsers[key]
+        else:
+            _cache_info.misses += 1
+            parser = _parsers[key] = cls._create(name, module)
+            if len(_parsers) > _cache_info.maxsize:
+                _parsers.popitem(last=False)
+
+        if parser:
+            mkapi.graph.record(parser.obj.fullname)
+            if isinstance(parser.obj, Class):
+                _record_base_classes(parser.obj)
+
+        return parser
+
+    @classmethod
+    def _create(cls, name: str, module: str | None) -> Parser | None:
         if not module:
             if not (name_module := split_module_name(name)):
                 return None
@@ -134,7 +191,9 @@ class Parser:
 
         """
         module = self.obj.module or self.obj.name
-        return get_fullname_from_module(name, module)
+        fullname = get_fullname_from_module(name, module)
+        mkapi.graph.record(fullname)
+        return fullname
 
     def replace_from_object(self, name: str) -> str | None:
         """Replace the name with the full name from the object.
@@ -146,8 +205,11 @@ class Parser:
             str | None: The full name if the name is valid, otherwise None.
 
         """
-        return get_fullname_from_object(name, self.obj)
+        fullname = get_fullname_from_object(name, self.obj)
+        mkapi.graph.record(fullname)
+        return fullname
 
+    @_memoize
     def parse_name_set(self) -> NameSet:
         """Parse the name set.
 
@@ -200,6 +262,7 @@ class Parser:
             type_params,
         )
 
+    @_memoize
     def parse_signature(self) -> list[tuple[str, str]]:
         """Parse the signature.
 
@@ -225,6 +288,7 @@ class Parser:
 
         return signatures
 
+    @_memoize
     def parse_bases(self) -> list[str]:
         """Parse the base classes.
 
@@ -242,6 +306,7 @@ class Parser:
 
         return bases
 
+    @_memoize
     def parse_summary(self) -> str:
         """Parse the summary.
 
@@ -252,6 +317,7 @@ class Parser:
         summary = self.obj.doc.text.split("\n\n", maxsplit=1)[0]
         return get_markdown_text(summary, self.replace_from_object)
 
+    @_memoize
     def parse_doc(self) -> Doc:
         """Parse the doc.
 
@@ -297,6 +363,13 @@ class Parser:
                 yield section
 
 
+def _record_base_classes(cls: Class) -> None:
+    for base in astdoc.object.get_base_classes(cls.name, cls.module):
+        if base is not cls:
+            mkapi.graph.record(base.fullname)
+            _record_base_classes(base)
+
+
 PREFIX = "__mkapi__."
 
 
@@ -916,12 +989,143 @@ def merge_sections(
         merge_returns(sections, obj.node.returns, obj.module)
 
 
+@dataclass
+class Summary:
+    """Represent the summary of an object in a summary section."""
+
+    name: str
+    """The name of the object in Markdown."""
+
+    id: str
+    """The id of the object."""
+
+    text: str
+    """The first paragraph of the docstring in Markdown."""
+
+    modules: set[str] = field(default_factory=set, repr=False, compare=False)
+    """The modules read to create the summary."""
+
+
+def create_summary(name: str, module: str | None) -> Summary | None:
+    """Create a summary for the given name in the given module.
+
+    The summary holds the same name, id, and first paragraph that a
+    `Parser` would create with `parse_name_set` and `parse_summary`,
+    without the cost of a full parser.
+
+    Args:
+        name (str): The name of the object.
+        module (str | None): The name of the module.
+
+    Returns:
+        Summary | None: The summary if created, otherwise None.
+
+    """
+    if not module and (name_module := split_module_name(name)):
+        name, module = name_module
+
+    obj = get_object(name, module)
+
+    if not isinstance(obj, Attribute | Class | Function | Module | Property):
+        return None
+
+    qualname = name.replace("_", "\\_")
+    if module:
+        id_ = f"{module}.{name}"
+        qualname = qualname.rsplit(".", 1)[-1]
+    else:
+        id_ = name
+
+    def replace(name: str) -> str | None:
+        fullname = get_fullname_from_object(name, obj)
+        mkapi.graph.record(fullname)
+        return fullname
+
+    with mkapi.graph.capture() as modules:
+        mkapi.graph.record(obj.fullname)
+        text = obj.doc.text.split("\n\n", maxsplit=1)[0]
+        text = get_markdown_text(text, replace)
+
+    return Summary(qualname, id_, text, modules)
+
+
+@dataclass
+class SummaryIndex:
+    """Represent the summaries of the members of a module."""
+
+    sections: dict[str, list[str]] = field(default_factory=dict)
+    """The member names keyed by summary section name."""
+
+    summaries: dict[str, Summary | None] = field(default_factory=dict)
+    """The summaries keyed by name."""
+
+
+def get_summary_index(module: str | None) -> SummaryIndex:
+    """Return the summary index of the given module.
+
+    The index is created in one pass over the members of the module,
+    which are grouped into the Classes, Functions, and Modules sections.
+    Other names, such as methods of classes, are added when they are
+    first looked up by `get_summary`.
+
+    Args:
+        module (str | None): The name of the module.
+
+    Returns:
+        SummaryIndex: The summary index.
+
+    """
+    if module in _summary_indexes:
+        return _summary_indexes[module]
+
+    index = _summary_indexes[module] = SummaryIndex()
+
+    if not module:
+        return index
+
+    for name, member in get_module_members(module, child_only=True):
+        if isinstance(member, Module):
+            section = "Modules"
+        elif isinstance(member.node, ast.ClassDef):
+            section = "Classes"
+        elif isinstance(member.node, ast.FunctionDef | ast.AsyncFunctionDef):
+            section = "Functions"
+        else:
+            continue
+
+        index.sections.setdefault(section, []).append(name)
+        index.summaries[name] = create_summary(name, module)
+
+    return index
+
+
+def get_summary(name: str, module: str | None) -> Summary | None:
+    """Return the summary for the given name from the summary index.
+
+    Args:
+        name (str): The name of the object.
+        module (str | None): The name of the module.
+
+    Returns:
+        Summary | None: The summary if found, otherwise None.
+
+    """
+    summaries = get_summary_index(module).summaries
+
+    if name not in summaries:
+        summaries[name] = create_summary(name, module)
+
+    if summary := summaries[name]:
+        mkapi.graph.record_modules(summary.modules)
+
+    return summary
+
+
 def create_summary_item(name: str, module: str | None) -> Item | None:
     """Create a summary item for the given name in the given module.
 
-    Take a fully qualified name, create a parser for it,
-    and extract the name set and summary from the parser.
-    Construct an Item with the name, type (None), and summary.
+    Take a fully qualified name, look up its summary in the summary index,
+    and construct an Item with the name, type (None), and summary.
 
     Args:
         name (str): The fully qualified name of the object.
@@ -931,13 +1135,11 @@ def create_summary_item(name: str, module: str | None) -> Item | None:
         Item | None: The summary item if created, otherwise None.
 
     """
-    if not (parser := Parser.create(name, module)):
+    if not (summary := get_summary(name, module)):
         return None
 
-    name_set = parser.parse_name_set()
-    summary = parser.parse_summary()
-    name = f"[{name_set.name}][{PREFIX}{name_set.id}]"
-    return Item(name, None, summary)
+    name = f"[{summary.name}][{PREFIX}{summary.id}]"
+    return Item(name, None, summary.text)
 
 
 def create_classes_from_module(module: str) -> Section | None:
@@ -955,7 +1157,7 @@ def create_classes_from_module(module: str) -> Section | None:
 
     """
     items = []
-    for name in iter_classes_from_module(module):
+    for name in get_summary_index(module).sections.get("Classes", []):
         if item := create_summary_item(name, module):
             items.append(item)
 
@@ -976,7 +1178,7 @@ def create_functions_from_module(module: str) -> Section | None:
 
     """
     items = []
-    for name in iter_functions_from_module(module):
+    for name in get_summary_index(module).sections.get("Functions", []):
         if item := create_summary_item(name, module):
             items.append(item)
 
@@ -998,7 +1200,7 @@ def create_modules_from_module(module: str) -> Section | None:
 
     """
     items = []
-    for name in iter_modules_from_module(module):
+    for name in get_summary_index(module).sections.get("Modules", []):
         if item := create_summary_item(name, module):
             items.append(item)
 
@@ -1019,11 +1221,11 @@ def create_modules_from_module_file(module: str) -> Section | None:
         Section | None: The Modules section if created, otherwise None.
 
     """
-    if not is_package(module):
+    if not (tree := mkapi.nav.get_package_tree(module, recursive=False)):
         return None
 
     items = []
-    for name in find_submodule_names(module):
+    for name, _ in tree:
         if name.split(".")[-1].startswith("_"):
             continue
 
@@ -1077,3 +1279,62 @@ def _clean_item_text(text: str) -> Iterator[str]:
 
         yield line
         prev = line
+
+
+@dataclass
+class CacheInfo:
+    """Represent the statistics of the parser cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_parsers: OrderedDict[tuple[str, str | None], Parser | None] = cache(OrderedDict())
+_summary_indexes: dict[str | None, SummaryIndex] = cache({})
+_cache_info = CacheInfo(0, 0, 4096, 0)
+
+
+def get_cache_info() -> CacheInfo:
+    """Return the statistics of the parser cache.
+
+    Returns:
+        CacheInfo: The number of hits and misses, the maximum size,
+        and the current size of the cache.
+
+    """
+    info = _cache_info
+    return CacheInfo(info.hits, info.misses, info.maxsize, len(_parsers))
+
+
+def clear_cache(module: str | None = None) -> None:
+    """Clear the parser cache.
+
+    Args:
+        module (str | None): If given, remove only the parsers and summary
+            indexes that depend on the module. Otherwise, remove all of them
+            and reset the statistics.
+
+    """
+    if module is None:
+        _parsers.clear()
+        _summary_indexes.clear()
+        _cache_info.hits = _cache_info.misses = 0
+        return
+
+    for key, parser in list(_parsers.items()):
+        if key[1] == module or (parser and _depends_on(parser, module)):
+            del _parsers[key]
+
+    for key, index in list(_summary_indexes.items()):
+        summaries = index.summaries.values()
+        if key == module or any(s and module in s.modules for s in summaries):
+            del _summary_indexes[key]
+
+
+def _depends_on(parser: Parser, module: str) -> bool:
+    if (parser.obj.module or parser.obj.name) == module:
+        return True
+
+    return any(module in modules for _, modules in parser._results.values())  # noqa: SLF001
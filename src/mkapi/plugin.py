@@ -1,24 +1,47 @@
 from __future__ import annotations
 
-import fnmatch
+import posixpath
+import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import mkdocs.commands.build
 from astdoc.markdown import set_example_class
-from astdoc.utils import cache_clear, get_module_path, is_package
+from astdoc.object import get_object
+from astdoc.utils import cache_clear, get_module_path
 from mkdocs.plugins import BasePlugin, get_plugin_logger
 from mkdocs.structure.files import File, InclusionLevel
 
 import mkapi
+import mkapi.cache
+import mkapi.graph
 import mkapi.nav
+import mkapi.parser
+import mkapi.profile
 import mkapi.renderer
+import mkapi.writer
 from mkapi.config import Config, get_config, get_function, set_config
-from mkapi.page import Page
+from mkapi.page import (
+    OBJECT_PATTERN,
+    URIS,
+    Page,
+    get_chunk_uri,
+    get_source_chunks,
+    has_markup,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from jinja2 import Environment
     from mkdocs.config.defaults import MkDocsConfig
+    from mkdocs.livereload import LiveReloadServer
     from mkdocs.structure.files import Files
+    from mkdocs.structure.nav import Navigation
     from mkdocs.structure.pages import Page as MkDocsPage
     from mkdocs.structure.toc import AnchorLink, TableOfContents
 
@@ -29,25 +52,83 @@ logger = get_plugin_logger("mkapi")
 class Plugin(BasePlugin[Config]):
     pages: dict[str, Page]
     elapsed_time: float
+    is_serve: bool
+    is_watching: bool
 
     def __init__(self) -> None:
         self.pages = {}
+        self.is_serve = False
+        self.is_watching = False
+        # Source pages rendered as a placeholder in `mkdocs serve`, keyed by
+        # the destination URI. The pages collected in the current build are
+        # published in `on_post_build`, together with the state to render them.
+        self._lazy_pages: dict[str, MkDocsPage] = {}
+        self._pending: dict[str, MkDocsPage] = {}
+        self._requested: set[str] = set()
+        self._state: tuple[MkDocsConfig, Files, Navigation, Environment] | None = None
+        self._nav: Navigation | None = None
+        self._lock = threading.Lock()
+        # The rendered content of API pages in the previous rebuild of
+        # `mkdocs serve`, keyed by the source URI. A page is reused as long as
+        # the modules it read and the pages it can link to are unchanged.
+        self._rendered: dict[str, _Rendered] = {}
+        self._rendered_state: tuple | None = None
+        self._modified: set[str] | None = None
+        # The number of documentation pages without any object line or link,
+        # which are passed through without conversion.
+        self._skipped = 0
         set_example_class("mkapi-example-input", "mkapi-example-output")
 
+    def on_startup(self, *, command: str, dirty: bool) -> None:
+        # Source pages of a dirty build are skipped when unchanged, so that
+        # a placeholder would never be replaced.
+        self.is_serve = command == "serve" and not dirty
+        # Caches are kept across the rebuilds of `mkdocs serve`, except for
+        # the entries derived from modified modules.
+        self.is_watching = command == "serve"
+        mkapi.graph.MTIMES.clear()
+        mkapi.graph.LISTINGS.clear()
+        self._rendered.clear()
+        self._rendered_state = None
+
     def on_config(self, config: MkDocsConfig, **kwargs) -> MkDocsConfig:
+        with self._lock:
+            self._lazy_pages = {}
+            self._pending = {}
+            self._state = None
+
         self.elapsed_time = 0
-        cache_clear()
+        self._skipped = 0
+        if self.is_watching:
+            self._modified = _clear_cache()
+        else:
+            cache_clear()
+        mkapi.cache.counts.clear()
+        mkapi.profile.clear()
         set_config(self.config)
 
+        if self.config.lazy_source and not _supports_lazy_source():
+            self.config.lazy_source = False
+            msg = "lazy_source is disabled: not supported by this version of MkDocs"
+            logger.warning(msg)
+
+        if path := mkapi.cache.get_cache_dir():
+            mkapi.graph.load(path / "graph.json")
+
         if before_on_config := get_function("before_on_config"):
             before_on_config(config, self)
 
-        mkapi.renderer.load_templates()
+        _load_templates()
 
         _update_extensions(config)
 
-        _build_apinav(config)
-        self.elapsed_time += _update_nav(config, self.pages)
+        predicate = _get_predicate()
+
+        with mkapi.profile.timer("nav"):
+            _build_apinav(config, predicate)
+
+        with mkapi.profile.timer("registration"):
+            self.elapsed_time += _update_nav(config, self.pages, predicate)
 
         if after_on_config := get_function("after_on_config"):
             after_on_config(config, self)
@@ -57,6 +138,10 @@ class Plugin(BasePlugin[Config]):
     def on_files(self, files: Files, config: MkDocsConfig, **kwargs) -> Files:
         start_time = time.perf_counter()
 
+        if self.is_watching:
+            self._discard_rendered()
+
+        pages: list[Page] = []
         for src_uri, page in self.pages.items():
             if page.is_api_page():
                 if src_uri in files.src_uris:
@@ -66,20 +151,34 @@ class Plugin(BasePlugin[Config]):
                     se = page.is_source_page() and self.config.source_search_exclude
                 file = generate_file(config, src_uri, page.name, search_exclude=se)
                 files.append(file)
-                if file.is_modified():
-                    msg = f"Generating markdown for {src_uri!r}..."
-                    logger.debug(msg)
+                if src_uri not in self._rendered and file.is_modified():
+                    pages.append(page)
+
+        with mkapi.profile.timer("registration"):
+            _register_pages(self.pages.values())
+
+        if self.config.workers > 1 and len(pages) > 1:
+            with mkapi.profile.timer("generation"):
+                _prerender_pages(pages, self.config.workers)
+        else:
+            for page in pages:
+                msg = f"Generating markdown for {page.src_uri!r}..."
+                logger.debug(msg)
+                with mkapi.profile.timer("generation", page.src_uri):
                     page.generate_markdown()
 
+        if self.is_watching:
+            self._check_rendered(config)
+
         for file in files:
             if page := self.pages.get(file.src_uri):
                 if page.is_source_page():
                     file.inclusion = InclusionLevel.NOT_IN_NAV
 
             elif file.is_documentation_page():
-                content = file.content_string
+                # The content is passed to `on_page_markdown` by MkDocs.
                 src_uri = file.src_uri
-                self.pages[src_uri] = Page.create_documentation(src_uri, content)
+                self.pages[src_uri] = Page.create_documentation(src_uri)
 
         for file in _collect_css(config):
             files.append(file)
@@ -105,11 +204,27 @@ class Plugin(BasePlugin[Config]):
         start_time = time.perf_counter()
         src_uri = page.file.src_uri
 
+        if src_uri in self._rendered:
+            # The content is restored in `on_page_content`, so that MkDocs
+            # does not convert the markdown again.
+            return ""
+
+        if self._is_lazy(src_uri):
+            self._lazy_pages[page.file.dest_uri] = page
+            msg = f"Deferred rendering of {src_uri!r} until requested"
+            logger.debug(msg)
+            return _placeholder(self.pages[src_uri])
+
+        if self.pages[src_uri].is_documentation_page() and not has_markup(markdown):
+            self._skipped += 1
+            return markdown
+
         msg = f"Converting markdown for {src_uri!r}..."
         logger.debug(msg)
 
         try:
-            markdown = self.pages[src_uri].convert_markdown(markdown)
+            with mkapi.profile.timer("conversion", src_uri):
+                markdown = self.pages[src_uri].convert_markdown(markdown)
         except Exception as e:
             if self.config.debug:
                 raise
@@ -130,8 +245,7 @@ class Plugin(BasePlugin[Config]):
             else:
                 path = Path(config.docs_dir) / src_uri
 
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(markdown, encoding="utf-8")
+            mkapi.writer.write(path, markdown)
 
         return markdown
 
@@ -141,18 +255,393 @@ class Plugin(BasePlugin[Config]):
         src_uri = page.file.src_uri
         page_ = self.pages[src_uri]
 
+        if rendered := self._rendered.get(src_uri):
+            return rendered.restore(page)
+
         if page_.is_api_page():
-            _replace_toc(page.toc)
+            with mkapi.profile.timer("toc", src_uri):
+                _replace_toc(page.toc)
+
+        with mkapi.profile.timer("html", src_uri):
+            html = page_.convert_html(html)
 
-        html = page_.convert_html(html)
+        is_placeholder = page.file.dest_uri in self._lazy_pages
+        if self.is_watching and page_.is_api_page() and not is_placeholder:
+            self._rendered[src_uri] = _Rendered.create(page, html)
 
         self.elapsed_time += time.perf_counter() - start_time
         return html
 
+    def on_nav(self, nav: Navigation, *args, **kwargs) -> Navigation:
+        self._nav = nav
+        return nav
+
+    def on_env(
+        self,
+        env: Environment,
+        config: MkDocsConfig,
+        files: Files,
+        **kwargs,
+    ) -> Environment:
+        if self._lazy_pages and self._nav:
+            self._state = (config, files, self._nav, env)
+
+        return env
+
     def on_post_build(self, *args, **kwargs) -> None:
         msg = f"{len(self.pages)} pages built in {self.elapsed_time:.2f} seconds"
         logger.info(msg)
 
+        if self._skipped:
+            msg = f"{self._skipped} pages without MkAPI syntax passed through"
+            logger.info(msg)
+
+        if self._lazy_pages:
+            with self._lock:
+                self._pending = self._lazy_pages
+
+            msg = f"{len(self._pending)} source pages deferred until requested"
+            logger.info(msg)
+
+        self._report_memory()
+
+        if self.config.save:
+            paths = mkapi.writer.flush()
+            msg = f"{len(paths)} saved markdown files written"
+            logger.info(msg)
+
+        if self.is_watching:
+            modules = set().union(*mkapi.graph.DEPENDENCIES.values())
+            mkapi.graph.snapshot(modules)
+
+        if path := mkapi.cache.get_cache_dir():
+            mkapi.graph.save(path / "graph.json")
+
+            counts = mkapi.cache.counts
+            msg = f"Render cache: {counts['hit']} hits, {counts['miss']} misses"
+            logger.info(msg)
+
+        if self.config.profile:
+            path = Path(self.config.profile)
+            mkapi.profile.save(path)
+            msg = f"Profile report written to {path.as_posix()!r}"
+            logger.info(msg)
+
+    def on_serve(
+        self,
+        server: LiveReloadServer,
+        *args,
+        **kwargs,
+    ) -> LiveReloadServer:
+        if self.config.lazy_source:
+            serve_request = server._serve_request  # noqa: SLF001
+
+            def _serve_request(
+                environ: dict,
+                start_response: Callable,
+            ) -> Iterable[bytes] | None:
+                self.render_requested_page(server, environ["PATH_INFO"])
+                return serve_request(environ, start_response)
+
+            server._serve_request = _serve_request  # noqa: SLF001
+
+        return server
+
+    def _report_memory(self) -> None:
+        # Markdown of converted pages has been released, so what is left is
+        # the markdown of deferred pages and the content kept for reuse.
+        pages = self.pages.values()
+        memory = {
+            "markdown": sum(sys.getsizeof(page.markdown) for page in pages),
+            "rendered": sum(sys.getsizeof(r.content) for r in self._rendered.values()),
+            "peak": mkapi.profile.get_peak_memory() or 0,
+        }
+        mkapi.profile.memory.update(memory)
+
+        mb = {k: v / 2**20 for k, v in memory.items()}
+        msg = f"Memory: {mb['markdown']:.1f} MB of markdown in {len(pages)} pages"
+        if memory["rendered"]:
+            msg += f", {mb['rendered']:.1f} MB of rendered pages"
+        if memory["peak"]:
+            msg += f", {mb['peak']:.0f} MB at peak"
+        logger.info(msg)
+
+    def _discard_rendered(self) -> None:
+        # The markdown of a page depends only on the modules it read, so the
+        # pages that are kept are neither generated nor converted again.
+        if (modified := self._modified) is None:
+            self._rendered.clear()
+            return
+
+        for src_uri in list(self._rendered):
+            modules = mkapi.graph.DEPENDENCIES.get(src_uri)
+            if src_uri not in self.pages or not modules or modules & modified:
+                del self._rendered[src_uri]
+
+    def _check_rendered(self, config: MkDocsConfig) -> None:
+        # Links are resolved with the registered URIs of objects, so any
+        # change to them, to the set of pages, to the templates, or to the
+        # MkDocs configuration discards all rendered pages.
+        src_uris = sorted(uri for uri, page in self.pages.items() if page.is_api_page())
+        state = (
+            _get_mtime(config.config_file_path),
+            mkapi.cache.get_templates_hash(),
+            src_uris,
+            {namespace: dict(uris) for namespace, uris in URIS.items()},
+        )
+        if state != self._rendered_state:
+            self._rendered.clear()
+
+        self._rendered_state = state
+
+        if self._rendered:
+            msg = f"Reusing {len(self._rendered)} API pages from the previous build"
+            logger.info(msg)
+
+    def _is_lazy(self, src_uri: str) -> bool:
+        if not (self.is_serve and self.config.lazy_source):
+            return False
+
+        if src_uri in self._requested or not (page := self.pages.get(src_uri)):
+            return False
+
+        return page.is_source_page()
+
+    def render_requested_page(self, server: LiveReloadServer, path: str) -> None:
+        """Render a deferred source page when it is requested in `mkdocs serve`.
+
+        Wait for an ongoing rebuild as the server does, then render the page
+        and write its HTML to the site directory before the server reads it.
+        Once requested, the source page is rendered in all later rebuilds.
+
+        Args:
+            server (LiveReloadServer): The server of `mkdocs serve`.
+            path (str): The path of the request.
+
+        """
+        if not self._pending or not (path + "/").startswith(server.mount_path):
+            return
+
+        uri = path[len(server.mount_path) :]
+        if not uri or uri.endswith("/"):
+            uri += "index.html"
+        uri = posixpath.normpath("/" + uri).lstrip("/")
+
+        if uri not in self._pending:
+            return
+
+        # Wait until a running rebuild has finished, if the server tells.
+        if (epoch_cond := getattr(server, "_epoch_cond", None)) is not None:
+            with epoch_cond:
+                epoch_cond.wait_for(
+                    lambda: server._visible_epoch == server._wanted_epoch,  # noqa: SLF001
+                )
+
+        with self._lock:
+            if not (page := self._pending.pop(uri, None)) or not self._state:
+                return
+
+            src_uri = page.file.src_uri
+            self._requested.add(src_uri)
+            msg = f"Rendering {src_uri!r} on request..."
+            logger.info(msg)
+
+            config, files, nav, env = self._state
+            build = mkdocs.commands.build
+            build._populate_page(page, config, files)  # noqa: SLF001
+            build._build_page(page, config, files.documentation_pages(), nav, env)  # noqa: SLF001
+
+
+def _supports_lazy_source() -> bool:
+    # Lazy source pages rely on private parts of MkDocs, which may change
+    # in any release.
+    from mkdocs.livereload import LiveReloadServer
+
+    build = mkdocs.commands.build
+    if not hasattr(build, "_populate_page") or not hasattr(build, "_build_page"):
+        return False
+
+    return hasattr(LiveReloadServer, "_serve_request")
+
+
+def _register_pages(pages: Iterable[Page]) -> None:
+    # Names are registered from the member index of each module before any
+    # page is generated, so that the link targets are known up front. Pages
+    # that are not generated in a dirty build are registered too. URIS is
+    # filled again in page order, so that the names of removed objects are
+    # dropped and URIS is the same as in a full build.
+    URIS.clear()
+    for page in pages:
+        if page.is_api_page():
+            page.register()
+
+
+def _clear_cache() -> set[str] | None:
+    # Caches of astdoc are functions that cannot be cleared per entry, and
+    # parsers and summary indexes hold the objects created by astdoc, so all
+    # caches are cleared once any module is modified. The pages that did not
+    # read a modified module are reused from the previous build instead.
+    # Return the modified modules, or None if they are not known.
+    if (modules := mkapi.graph.get_modified_modules()) is None:
+        cache_clear()
+        return None
+
+    if modules:
+        msg = f"Clearing caches for {len(modules)} modified modules..."
+        logger.info(msg)
+        cache_clear()
+
+    # The config file and templates may have changed without any module.
+    get_function.cache_clear()  # type: ignore
+    mkapi.cache.get_templates_hash.cache_clear()  # type: ignore
+    return modules
+
+
+def _get_mtime(path: str | None) -> float | None:
+    try:
+        return Path(path).stat().st_mtime if path else None
+    except OSError:
+        return None
+
+
+@dataclass
+class _Rendered:
+    """The state of a MkDocs page set by `Page.render` and the plugins."""
+
+    content: str
+    toc: TableOfContents
+    title: str | None
+    present_anchor_ids: set[str] | None
+    links_to_anchors: dict[File, dict[str, str]] | None
+
+    @classmethod
+    def create(cls, page: MkDocsPage, content: str) -> _Rendered:
+        title = page._title_from_render  # noqa: SLF001
+        anchors = page.present_anchor_ids
+        return cls(content, page.toc, title, anchors, page.links_to_anchors)
+
+    def restore(self, page: MkDocsPage) -> str:
+        page.toc = self.toc
+        page._title_from_render = self.title  # noqa: SLF001
+        page.present_anchor_ids = self.present_anchor_ids
+        page.links_to_anchors = self.links_to_anchors
+        return self.content
+
+
+def _placeholder(page: Page) -> str:
+    # Keep the anchors of the objects, so that links to the page can be
+    # validated without rendering the source.
+    message = "The source is rendered when this page is requested."
+    lines = [f"# {page.name}", "", message]
+    for match in OBJECT_PATTERN.finditer(page.markdown):
+        name, _, module = match.group("object").partition(" ")
+        fullname = f"{module}.{name}" if module else name
+        lines.append(f'<span id="{fullname}"></span>')
+
+    return "\n".join(lines) + "\n"
+
+
+def _prerender_pages(pages: list[Page], workers: int) -> None:
+    msg = f"Rendering {len(pages)} API pages with {workers} workers..."
+    logger.info(msg)
+
+    # Each worker renders one contiguous block of pages in nav order. Before
+    # that, it loads the modules of the preceding pages that the block read
+    # in the previous build, or all of them if the block has not been built
+    # before, so that the objects known to astdoc when rendering a page are
+    # the same as in a serial build.
+    size = -(-len(pages) // workers)
+    blocks = [pages[k : k + size] for k in range(0, len(pages), size)]
+    names = [page.name for page in pages]
+    initargs = (sys.path, dict(get_config()), mkapi.graph.DEPENDENCIES)
+
+    with ProcessPoolExecutor(
+        len(blocks),
+        initializer=_initialize_worker,
+        initargs=initargs,
+    ) as executor:
+        futures = [
+            executor.submit(_prerender_block, block, _preload(block, names[: k * size]))
+            for k, block in enumerate(blocks)
+        ]
+        results = []
+        for future in futures:
+            results_, times = future.result()
+            results.extend(results_)
+            mkapi.profile.update_objects(times)
+
+    for page, result in zip(pages, results, strict=True):
+        if isinstance(result, str):
+            msg = f"{page.src_uri}:{result}"
+            logger.warning(msg)
+            page.generate_markdown()
+            continue
+
+        page.markdown, page.rendered, modules = result
+        mkapi.graph.update(page.src_uri, modules)
+
+
+def _preload(pages: list[Page], names: list[str]) -> list[str]:
+    modules = set()
+    for page in pages:
+        if page.src_uri not in mkapi.graph.DEPENDENCIES:
+            return names
+
+        modules.update(mkapi.graph.DEPENDENCIES[page.src_uri])
+
+    return [name for name in names if name in modules]
+
+
+def _initialize_worker(
+    path: list[str],
+    config: dict,
+    dependencies: dict[str, set[str]],
+) -> None:
+    sys.path[:] = path
+    mkapi.graph.DEPENDENCIES.update(dependencies)
+
+    config_ = Config()  # type: ignore
+    config_.load_dict(config)
+    set_config(config_)
+
+    set_example_class("mkapi-example-input", "mkapi-example-output")
+    _load_templates()
+
+
+Rendered = tuple[str, str | None, set[str]]
+
+
+def _prerender_block(
+    pages: list[Page],
+    names: list[str],
+) -> tuple[list[Rendered | str], dict[str, dict[str, float]]]:
+    for name in names:
+        get_object(name)
+
+    results = [_prerender_page(page) for page in pages]
+    times = {id_: dict(parts) for id_, parts in mkapi.profile.objects.items()}
+    return results, times
+
+
+def _prerender_page(page: Page) -> Rendered | str:
+    # The error is reported by the main process, which then generates the
+    # page itself.
+    try:
+        page.generate_markdown()
+        page.render_markdown()
+    except Exception as e:  # noqa: BLE001
+        return f"{type(e).__name__}: {e}"
+
+    modules = mkapi.graph.DEPENDENCIES[page.src_uri]
+    return page.markdown, page.rendered, modules
+
+
+def _load_templates() -> None:
+    path = mkapi.cache.get_cache_dir()
+    cache_dir = path / "templates" if path else None
+    native = get_config().native_render
+    mkapi.renderer.load_templates(cache_dir=cache_dir, native=native)
+
 
 def _update_extensions(config: MkDocsConfig) -> None:
     for name in ["admonition", "attr_list", "md_in_html", "pymdownx.superfences"]:
@@ -160,34 +649,56 @@ def _update_extensions(config: MkDocsConfig) -> None:
             config.markdown_extensions.append(name)
 
 
-def _build_apinav(config: MkDocsConfig) -> None:
+def _get_predicate() -> Callable[[str], bool]:
+    is_excluded = mkapi.nav.compile_exclude(get_config().exclude or [])
+
+    def predicate(name: str) -> bool:
+        if name.split(".")[-1].startswith("_"):
+            return False
+
+        return not is_excluded(name)
+
+    return predicate
+
+
+def _build_apinav(
+    config: MkDocsConfig,
+    predicate: Callable[[str], bool] | None = None,
+) -> None:
     if not config.nav:
         return
 
+    packages = []
+    paths = []
+
+    # The directories of packages are the roots of the scanned package trees.
     def watch_directory(name: str, *args) -> list:
         name, depth = mkapi.nav.split_name_depth(name)
-        if path := get_module_path(name):
-            path = str(path.parent if depth else path)
-            if path not in config.watch:
-                config.watch.append(path)
+        if depth and mkapi.nav.is_package(name):
+            packages.append((name, depth))
+        elif path := get_module_path(name):
+            paths.append(str(path))
 
         return []
 
     mkapi.nav.build_apinav(config.nav, watch_directory)
+    paths.extend(mkapi.nav.scan_packages(packages, predicate or _get_predicate()))
 
+    for path in paths:
+        if path not in config.watch:
+            config.watch.append(path)
 
-def _update_nav(config: MkDocsConfig, pages: dict[str, Page]) -> float:
+
+def _update_nav(
+    config: MkDocsConfig,
+    pages: dict[str, Page],
+    predicate: Callable[[str], bool] | None = None,
+) -> float:
     if not (nav := config.nav):
         return 0
 
-    def predicate(name: str) -> bool:
-        if name.split(".")[-1].startswith("_"):
-            return False
-
-        if not (exclude := get_config().exclude):
-            return True
-
-        return not any(fnmatch.fnmatch(name, ex) for ex in exclude)
+    predicate = predicate or _get_predicate()
+    registered: set[str] = set()
 
     def create_page(name: str, path: str) -> str:
         uri = name.replace(".", "/")
@@ -197,7 +708,7 @@ def _update_nav(config: MkDocsConfig, pages: dict[str, Page]) -> float:
         else:
             object_path, source_path = path, "src"
 
-        suffix = "/README.md" if is_package(name) else ".md"
+        suffix = "/README.md" if mkapi.nav.is_package(name) else ".md"
         object_uri = f"{object_path}/{uri}{suffix}"
         if object_uri not in pages:
             pages[object_uri] = Page.create_object(object_uri, name)
@@ -210,10 +721,15 @@ def _update_nav(config: MkDocsConfig, pages: dict[str, Page]) -> float:
             msg = f"Registered {source_uri!r} for {name!r}"
             logger.debug(msg)
 
+        if source_max_lines:
+            _split_source_page(pages, source_uri, name, source_max_lines)
+
+        registered.update([object_uri, source_uri, *pages[source_uri].chunk_uris])
         return object_uri
 
     page_title = get_function("page_title")
     section_title = get_function("section_title")
+    source_max_lines = get_config().source_max_lines
 
     exclude = get_config().exclude
     msg = f"Collecting API pages with {len(exclude or [])} exclusion patterns..."
@@ -223,6 +739,14 @@ def _update_nav(config: MkDocsConfig, pages: dict[str, Page]) -> float:
     mkapi.nav.update_nav(nav, create_page, section_title, page_title, predicate)
     elapsed_time = time.perf_counter() - start_time
 
+    # Pages of modules removed from the navigation since the previous build
+    # of `mkdocs serve`, e.g., by the changes of modules or exclusions.
+    for uri, page in list(pages.items()):
+        if page.is_api_page() and uri not in registered:
+            del pages[uri]
+            msg = f"Unregistered {uri!r} for {page.name!r}"
+            logger.debug(msg)
+
     msg = f"Navigation updated with {len(pages)} API pages"
     if elapsed_time > 0.1:
         msg += f" in {elapsed_time:.2f} seconds"
@@ -231,6 +755,37 @@ def _update_nav(config: MkDocsConfig, pages: dict[str, Page]) -> float:
     return elapsed_time
 
 
+def _split_source_page(
+    pages: dict[str, Page],
+    src_uri: str,
+    name: str,
+    size: int,
+) -> None:
+    # The pages of a split source page follow the source page, so that the
+    # pages from a previous build of `mkdocs serve` are updated in place.
+    chunks = get_source_chunks(name, size)
+    uris = [get_chunk_uri(src_uri, k) for k in range(len(chunks))]
+
+    for uri, lines in zip(uris, chunks, strict=True):
+        if not (page := pages.get(uri)):
+            page = pages[uri] = Page.create_source(uri, name)
+            msg = f"Registered {uri!r} for lines {lines[0]}-{lines[1]} of {name!r}"
+            logger.debug(msg)
+
+        page.lines = lines
+        page.chunk_uris = uris
+
+    if not chunks:
+        page = pages[src_uri]
+        page.lines = None
+        page.chunk_uris = []
+
+    k = max(len(chunks), 1)
+    while (uri := get_chunk_uri(src_uri, k)) in pages:
+        del pages[uri]
+        k += 1
+
+
 def _replace_toc(toc: TableOfContents | list[AnchorLink], depth: int = 0) -> None:
     toc_title = get_function("toc_title")
 
@@ -271,8 +826,10 @@ def generate_file(
 
     Create a `File` instance representing a generated file with the specified
     source URI and object name. The `is_modified` method is set to check if the
-    destination file exists and if it is older than the module path.
-    This is used to determine if the file needs to be rebuilt in dirty mode.
+    destination file exists and if it is older than any module read by the page
+    when it was last rendered, or older than the module path if the page has not
+    been rendered yet. This is used to determine if the file needs to be rebuilt
+    in dirty mode.
 
     Args:
         config (MkDocsConfig): The MkDocs configuration object.
@@ -296,10 +853,14 @@ def generate_file(
         if not dest_path.exists():
             return True
 
+        mtime = dest_path.stat().st_mtime
+        if (is_modified_ := mkapi.graph.is_modified(src_uri, mtime)) is not None:
+            return is_modified_
+
         if not (module_path := get_module_path(name)):
             return True
 
-        return dest_path.stat().st_mtime < module_path.stat().st_mtime
+        return mtime < module_path.stat().st_mtime
 
     file.is_modified = is_modified
     return file
@@ -0,0 +1,182 @@
+"""Profile the time spent by MkAPI in a build.
+
+When the `profile` option is set, measure the time spent in each phase of
+the build, in each page, and in each rendered object, and write a JSON report
+at the end of the build.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from mkapi.config import get_config
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+PHASES = ("nav", "registration", "generation", "conversion", "html", "toc")
+"""The phases of a build: nav discovery, page registration, markdown generation,
+markdown conversion, HTML conversion, and TOC rewrite."""
+
+PARTS = ("parse_name_set", "parse_signature", "parse_doc", "render_source")
+"""The parts of rendering an object."""
+
+phases: defaultdict[str, float] = defaultdict(float)
+"""The time spent in each phase."""
+
+pages: defaultdict[str, defaultdict[str, float]] = defaultdict(
+    lambda: defaultdict(float),
+)
+"""The time spent in each phase, keyed by the source URI of the page."""
+
+objects: defaultdict[str, defaultdict[str, float]] = defaultdict(
+    lambda: defaultdict(float),
+)
+"""The time spent in each part of rendering, keyed by the object id."""
+
+memory: dict[str, int] = {}
+"""The memory held by the pages at the end of the build, in bytes."""
+
+
+def is_enabled() -> bool:
+    """Return True if the `profile` option is set."""
+    return bool(get_config().profile)
+
+
+def clear() -> None:
+    """Clear the measured times."""
+    phases.clear()
+    pages.clear()
+    objects.clear()
+    memory.clear()
+
+
+@contextmanager
+def timer(phase: str, src_uri: str = "") -> Iterator[None]:
+    """Measure the time spent in a phase of the build.
+
+    Do nothing if the `profile` option is not set.
+
+    Args:
+        phase (str): The name of the phase.
+        src_uri (str): The source URI of the page, if the phase is
+            measured per page.
+
+    """
+    if not is_enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_time = time.perf_counter() - start
+        phases[phase] += elapsed_time
+        if src_uri:
+            pages[src_uri][phase] += elapsed_time
+
+
+@contextmanager
+def object_timer(id_: str, part: str) -> Iterator[None]:
+    """Measure the time spent in a part of rendering an object.
+
+    Do nothing if the `profile` option is not set.
+
+    Args:
+        id_ (str): The id of the object.
+        part (str): The name of the part, one of `PARTS`.
+
+    """
+    if not is_enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        objects[id_][part] += time.perf_counter() - start
+
+
+def update_objects(times: dict[str, dict[str, float]]) -> None:
+    """Add the object times measured elsewhere, e.g. in a worker process."""
+    for id_, parts in times.items():
+        for part, elapsed_time in parts.items():
+            objects[id_][part] += elapsed_time
+
+
+def get_peak_memory() -> int | None:
+    """Return the peak resident set size of the process in bytes.
+
+    Returns:
+        int | None: The peak resident set size, or None if it is not
+        available on the platform.
+
+    """
+    if resource is None:  # pragma: no cover
+        return None
+
+    size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return size if sys.platform == "darwin" else size * 1024
+
+
+def get_report(top: int = 20) -> dict:
+    """Return the profile report.
+
+    Args:
+        top (int): The number of the slowest objects to report.
+
+    Returns:
+        dict: The report with the total time of each phase, the times of
+        each page sorted by total time, the slowest objects with the
+        time of each part, and the memory held at the end of the build.
+
+    """
+
+    def total(times: dict[str, float]) -> float:
+        return sum(times.values())
+
+    def round_(times: dict[str, float]) -> dict[str, float]:
+        return {k: round(v, 6) for k, v in times.items()}
+
+    page_items = sorted(pages.items(), key=lambda x: total(x[1]), reverse=True)
+    object_items = sorted(objects.items(), key=lambda x: total(x[1]), reverse=True)
+
+    return {
+        "total": round(total(phases), 6),
+        "phases": round_({phase: phases.get(phase, 0) for phase in PHASES}),
+        "pages": [
+            {"src_uri": src_uri, "total": round(total(t), 6), **round_(t)}
+            for src_uri, t in page_items
+        ],
+        "objects": [
+            {"id": id_, "total": round(total(t), 6), **round_(t)}
+            for id_, t in object_items[:top]
+        ],
+        "memory": dict(memory),
+    }
+
+
+def save(path: Path, top: int = 20) -> None:
+    """Save the profile report to a JSON file.
+
+    Args:
+        path (Path): The path of the JSON file.
+        top (int): The number of the slowest objects to report.
+
+    """
+    report = get_report(top)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
@@ -13,14 +13,18 @@ from astdoc.object import (
     Function,
     Module,
     Property,
+    get_object,
     get_source,
     is_child,
     iter_objects,
 )
-from jinja2 import Environment, FileSystemLoader, Template
+from astdoc.utils import cache
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from markupsafe import escape
 
 import mkapi
 from mkapi.parser import Parser
+from mkapi.profile import object_timer
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -32,31 +36,84 @@ if TYPE_CHECKING:
 
 templates: dict[str, Template] = {}
 
+_defaults: dict[str, Template] = {}
+"""The templates loaded from the default directory, keyed by the name.
+While one of them is in use, the markup is built without Jinja2."""
 
-def load_templates(path: Path | None = None) -> None:
+_environments: dict[tuple[Path, Path | None], Environment] = {}
+
+
+def get_environment(path: Path, cache_dir: Path | None = None) -> Environment:
+    """Return the Jinja2 environment for the template directory.
+
+    An environment is created once per process for each directory and
+    reused, so that a template is compiled again only when its file has
+    been modified.
+
+    Args:
+        path (Path): The directory of the templates.
+        cache_dir (Path | None): The directory to store the compiled bytecode
+            of the templates in. If None, the bytecode is not stored on disk.
+
+    Returns:
+        Environment: The Jinja2 environment.
+
+    """
+    key = (path, cache_dir)
+    if env := _environments.get(key):
+        return env
+
+    bytecode_cache = None
+    if cache_dir:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+
+    loader = FileSystemLoader(path)
+    env = Environment(loader=loader, autoescape=True, bytecode_cache=bytecode_cache)
+    _environments[key] = env
+    return env
+
+
+def load_templates(
+    path: Path | None = None,
+    cache_dir: Path | None = None,
+    *,
+    native: bool = True,
+) -> None:
     """Load Jinja2 templates from the specified directory.
 
     Initialize the `templates` dictionary with Jinja2 templates
     loaded from the given directory path. If no path is provided, it defaults
     to the "templates" directory located in the same directory as the mkapi
-    module.
+    module. Compiled templates are reused while their files are unchanged.
+    See `get_environment`.
+
+    Unless `native` is False, the default templates are rendered by plain
+    string assembly, which gives the same output as Jinja2. Templates from
+    another directory are always rendered by Jinja2.
 
     Args:
         path (Path | None): The directory path from which to load the templates.
             If None, defaults to the "templates" directory in the mkapi module.
+        cache_dir (Path | None): The directory to store the compiled bytecode
+            of the templates in, if any.
+        native (bool): Whether to render the default templates without Jinja2.
 
     Returns:
         None
 
     """
-    if not path:
-        path = Path(mkapi.__file__).parent / "templates"
+    default = Path(mkapi.__file__).parent / "templates"
+    path = path or default
 
-    loader = FileSystemLoader(path)
-    env = Environment(loader=loader, autoescape=True)
+    env = get_environment(path, cache_dir)
 
     for name in path.iterdir():
         templates[name.stem] = env.get_template(name.name)
+        if native and path == default:
+            _defaults[name.stem] = templates[name.stem]
+        else:
+            _defaults.pop(name.stem, None)
 
 
 class TemplateKind(Enum):
@@ -69,12 +126,14 @@ class TemplateKind(Enum):
     SOURCE = "source"
 
 
-def render(
+def render(  # noqa: PLR0913
     name: str,
     module: str | None,
     level: int,
     namespace: str,
     predicate: Callable[[Parser, TemplateKind], bool] | None = None,
+    *,
+    lines: tuple[int, int] | None = None,
 ) -> str | None:
     """Render a template with the given parameters.
 
@@ -92,6 +151,8 @@ def render(
             A function that takes a `Parser` instance and a `TemplateKind` enum
             value, and returns a boolean indicating whether to render the
             corresponding template section. Defaults to None.
+        lines (tuple[int, int] | None, optional): The first and last lines of
+            the module source to render. Defaults to None for all lines.
 
     Returns:
         str | None: The rendered markdown string. Returns None if the name
@@ -102,22 +163,30 @@ def render(
         return None
 
     markdowns = []
+    id_ = f"{parser.module}.{parser.name}" if parser.module else parser.name
+
+    with object_timer(id_, "parse_name_set"):
+        name_set = parser.parse_name_set()
 
-    name_set = parser.parse_name_set()
     if level and (not predicate or predicate(parser, TemplateKind.HEADING)):
         markdowns.append(render_heading(name_set, level))
 
     if not predicate or predicate(parser, TemplateKind.OBJECT):
-        signature = parser.parse_signature()
+        with object_timer(id_, "parse_signature"):
+            signature = parser.parse_signature()
+
         markdowns.append(render_object(name_set, level, namespace, signature))
 
     if not predicate or predicate(parser, TemplateKind.DOCUMENT):
-        doc = parser.parse_doc()
-        bases = parser.parse_bases()
+        with object_timer(id_, "parse_doc"):
+            doc = parser.parse_doc()
+            bases = parser.parse_bases()
+
         markdowns.append(render_document(doc, bases))
 
     if not predicate or predicate(parser, TemplateKind.SOURCE):
-        markdowns.append(render_source(parser.obj))
+        with object_timer(id_, "render_source"):
+            markdowns.append(render_source(parser.obj, lines=lines))
 
     return "\n\n".join(markdowns)
 
@@ -136,6 +205,9 @@ def render_heading(name_set: NameSet, level: int) -> str:
         str: The rendered heading as a markdown string.
 
     """
+    if _is_default("heading"):
+        return _render_heading(name_set.id, name_set.fullname, level)
+
     return templates["heading"].render(
         id=name_set.id,
         fullname=name_set.fullname,
@@ -164,6 +236,9 @@ def render_object(
         str: The rendered object entry as a markdown string.
 
     """
+    if _is_default("object"):
+        return _render_object(name_set, level, namespace, signature)
+
     return templates["object"].render(
         kind=name_set.kind,
         name=name_set.name,
@@ -194,10 +269,153 @@ def render_document(doc: Doc, bases: list[str]) -> str:
         str: The rendered document as a markdown string.
 
     """
+    if _is_default("document"):
+        return _render_document(doc, bases)
+
     return templates["document"].render(doc=doc, bases=bases)
 
 
-def render_source(obj: Object, attr: str = "") -> str:
+def _is_default(name: str) -> bool:
+    return name in _defaults and templates.get(name) is _defaults[name]
+
+
+# The following functions build the same markup as the default templates,
+# without the overhead of Jinja2. Values that are not marked `safe` in the
+# templates are escaped. Keep them in sync with the templates.
+
+
+def _render_heading(id_: str, fullname: str, level: int) -> str:
+    return (
+        f'<h{level} class="mkapi-heading" id="{escape(id_)}" markdown="1">'
+        f"{escape(fullname)}</h{level}>"
+    )
+
+
+def _render_object(
+    name_set: NameSet,
+    level: int,
+    namespace: str,
+    signature: list[tuple[str, str]],
+) -> str:
+    namespace = escape(namespace)
+    id_ = escape(name_set.id)
+    obj_id = escape(name_set.obj_id)
+
+    parts = [
+        f'<p class="mkapi-object mkapi-page-{namespace}" id="{id_}" markdown="1">\n',
+        '<span class="mkapi-object-link">\n',
+    ]
+
+    if name_set.parent:
+        parts.append(
+            '<span class="mkapi-parent-toggle" title="Toggle class names">\n'
+            '<i class="fa-solid fa-square-plus"></i>\n</span>',
+        )
+
+    parts.append("\n")
+
+    if name_set.id != name_set.obj_id:
+        parts.append(
+            '<span class="mkapi-definition-link">'
+            f"[def][__mkapi__.__definition__.{obj_id}]</span>",
+        )
+
+    parts.append(
+        f"\n[{namespace}][__mkapi__.__{namespace}__.{obj_id}]\n"
+        '<span class="mkapi-document-toggle" title="Toggle all docs">\n'
+        '<i class="fa-regular fa-square-minus"></i>\n</span>\n</span>',
+    )
+
+    if name_set.kind:
+        parts.append(f'<span class="mkapi-object-kind">{escape(name_set.kind)}</span>')
+
+    parts.append("\n")
+
+    if name_set.parent:
+        parts.append(
+            '<span class="mkapi-object-parent">\n'
+            f"[{escape(name_set.parent)}][__mkapi__.{escape(name_set.parent_id)}]"
+            '<span class="mkapi-dot">.</span></span>',
+        )
+
+    parts.append(
+        f'<span class="mkapi-object-name">[{escape(name_set.name)}]'
+        f"[__mkapi__.{id_}]</span>",
+    )
+
+    if name_set.type_params:
+        names = (
+            f'<span class="mkapi-object-name">{type_param}</span>'
+            for type_param in name_set.type_params
+        )
+        parts.append('<span class="mkapi-object-name">[</span>')
+        parts.append('<span class="mkapi-comma">, </span>'.join(names))
+        parts.append('<span class="mkapi-object-name">]</span>')
+
+    if signature:
+        parts.append('<span class="mkapi-signature">')
+        for name, kind in signature:
+            parts.append(f'<span class="mkapi-{escape(kind)}">{name}</span>')
+        parts.append("</span>")
+
+    parts.append("\n</p>")
+    return "".join(parts)
+
+
+def _render_document(doc: Doc, bases: list[str]) -> str:
+    parts = ['<div class="mkapi-document" markdown="1">']
+
+    if bases:
+        spans = (f'<span class="mkapi-base">{base}</span>' for base in bases)
+        parts.append('<p class="mkapi-bases" markdown="1">Bases :\n')
+        parts.append('<span class="mkapi-comma">, </span>'.join(spans))
+        parts.append("</p>")
+
+    parts.append(f"\n\n{doc.text}\n\n")
+
+    for section in doc.sections:
+        if section.name and not getattr(section, "kind", None):
+            title = escape(section.name.lower())
+            parts.append(
+                '<p class="mkapi-section">\n<span class="mkapi-object-link">\n'
+                f'<span class="mkapi-section-toggle" title="Toggle {title}">\n'
+                '<i class="fa-regular fa-square-minus"></i>\n</span>\n</span>\n'
+                f'<span class="mkapi-section-name">{section.name}</span>\n</p>',
+            )
+
+        parts.append(
+            f'\n<div class="mkapi-section-content" markdown="1">\n{section.text}\n',
+        )
+
+        if section.items:
+            parts.append('<ul class="mkapi-item-list" markdown="1">\n')
+            for item in section.items:
+                parts.append('<li markdown="block">\n')
+                if item.name:
+                    parts.append(f'<span class="mkapi-item-name">{item.name}</span>')
+                if item.name and item.type:
+                    parts.append(" : ")
+                parts.append("\n")
+                if item.type:
+                    parts.append(f'<span class="mkapi-item-type">{item.type}</span>')
+                if item.text:
+                    if item.name or item.type:
+                        parts.append(' <span class="mkapi-dash">&mdash;</span>')
+                    parts.append(f"\n{item.text}\n")
+                parts.append("</li>\n")
+            parts.append("</ul>\n")
+
+        parts.append("</div>\n")
+
+    parts.append("\n</div>")
+    return "".join(parts)
+
+
+def render_source(
+    obj: Object,
+    attr: str = "",
+    lines: tuple[int, int] | None = None,
+) -> str:
     """Render the source code for the specified object.
 
     Render the source code for the specified object using the provided object
@@ -206,6 +424,8 @@ def render_source(obj: Object, attr: str = "") -> str:
     Args:
         obj (Object): The object to render.
         attr (str): The attribute name to render.
+        lines (tuple[int, int] | None): The first and last lines to render
+            for a module. If None, render all lines.
 
     Returns:
         str: The rendered source code as a markdown string.
@@ -214,9 +434,18 @@ def render_source(obj: Object, attr: str = "") -> str:
     if not isinstance(obj, Module | Class | Function | Attribute | Property):
         return ""
 
-    if source := _get_source(obj):
-        source = source.rstrip()
+    if isinstance(obj, Module):
+        source = _get_module_source(obj.name)
+    else:
+        source = _get_source(obj)
+
+    if source:
         start = 1 if isinstance(obj, Module) else obj.node.lineno
+        if lines and isinstance(obj, Module):
+            start, end = lines
+            source = "\n".join(source.split("\n")[start - 1 : end])
+
+        source = source.rstrip()
         attr = f'linenums="{start}"'
         backticks = "`" * max(find_max_backticks(source) + 1, 3)
         template = templates["source"]
@@ -225,6 +454,46 @@ def render_source(obj: Object, attr: str = "") -> str:
     return ""
 
 
+def split_source(module: Module, size: int) -> list[tuple[int, int]]:
+    """Split the source of a module into chunks of top-level statements.
+
+    A chunk is closed before the statement that makes it longer than `size`
+    lines. Chunks are only split before a statement that is separated from
+    the previous one by a blank line or a comment, so that a source link
+    placed on the line above a statement stays in the chunk of the statement.
+    A single long statement makes a chunk longer than `size` lines.
+
+    Args:
+        module (Module): The module to split.
+        size (int): The maximum number of lines of a chunk.
+
+    Returns:
+        list[tuple[int, int]]: The first and last lines of each chunk.
+
+    """
+    if not (source := get_source(module)):
+        return []
+
+    n = len(source.splitlines())
+    chunks = []
+    start = 1
+    end = 0
+
+    for stmt in module.node.body:
+        decorators = getattr(stmt, "decorator_list", [])
+        first = min([stmt.lineno, *(d.lineno for d in decorators)])
+        last = stmt.end_lineno or stmt.lineno
+
+        if start <= end < first - 1 and last - start >= size:
+            chunks.append((start, end))
+            start = end + 1
+
+        end = last
+
+    chunks.append((start, n))
+    return chunks
+
+
 def find_max_backticks(source_code: str) -> int:
     """Find the maximum number of consecutive backticks in the source code.
 
@@ -243,6 +512,15 @@ def find_max_backticks(source_code: str) -> int:
     return max(len(match) for match in matches)
 
 
+@cache
+def _get_module_source(name: str) -> str:
+    # The source of a module split into chunks is marked once for all pages.
+    if not isinstance(obj := get_object(name), Module):
+        return ""
+
+    return _get_source(obj)
+
+
 def _get_source(
     obj: Module | Class | Function | Attribute | Property,
     *,
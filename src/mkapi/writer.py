@@ -0,0 +1,129 @@
+"""Write the markdown of API pages saved by the `save` option.
+
+Files are written from a background thread, so that the build does not wait
+for the disk. A file is rewritten only if its content differs from that of
+the file on disk, so that unchanged files keep their modification time and
+do not trigger file watchers or the caches of other tools.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BATCH_SIZE = 64
+"""The maximum number of files written in a batch."""
+
+_queue: queue.Queue[tuple[Path, bytes] | None] = queue.Queue()
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+_directories: set[Path] = set()
+_errors: list[OSError] = []
+
+written: list[Path] = []
+"""The paths of the files written since the last flush."""
+
+
+def write(path: Path, text: str) -> None:
+    """Write a text file in the background.
+
+    Args:
+        path (Path): The path of the file.
+        text (str): The content of the file.
+
+    """
+    global _thread  # noqa: PLW0603
+
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="mkapi-writer", daemon=True)
+            _thread.start()
+
+        _queue.put((path, text.encode("utf-8")))
+
+
+def flush() -> list[Path]:
+    """Wait until all files have been written.
+
+    Returns:
+        list[Path]: The paths of the files written since the last flush.
+        Unchanged files are not included.
+
+    Raises:
+        OSError: If a file could not be written.
+
+    """
+    global _thread  # noqa: PLW0603
+
+    with _lock:
+        if _thread is not None:
+            _queue.put(None)
+            _thread.join()
+            _thread = None
+
+    _directories.clear()
+    paths = written.copy()
+    written.clear()
+
+    if _errors:
+        error = _errors[0]
+        _errors.clear()
+        raise error
+
+    return paths
+
+
+def _run() -> None:
+    while True:
+        batch = [_queue.get()]
+        # The thread is the only consumer, so the queue is not emptied
+        # between `empty` and `get_nowait`.
+        while len(batch) < BATCH_SIZE and not _queue.empty():
+            batch.append(_queue.get_nowait())
+
+        for item in batch:
+            if item is None:
+                return
+
+            try:
+                _write(*item)
+            except OSError as e:
+                _errors.append(e)
+
+
+def _write(path: Path, data: bytes) -> None:
+    if is_unchanged(path, data):
+        return
+
+    if path.parent not in _directories:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _directories.add(path.parent)
+
+    path.write_bytes(data)
+    written.append(path)
+
+
+def is_unchanged(path: Path, data: bytes) -> bool:
+    """Return True if the file has the same content as the data.
+
+    The file is read only if its size is the same as that of the data.
+
+    Args:
+        path (Path): The path of the file.
+        data (bytes): The new content of the file.
+
+    Returns:
+        bool: True if the file exists and its content is the same.
+
+    """
+    try:
+        if path.stat().st_size != len(data):
+            return False
+
+        return path.read_bytes() == data
+    except OSError:
+        return False
@@ -2,8 +2,29 @@ import importlib
 import sys
 from pathlib import Path
 
+import pytest
+
 path = str(Path(__file__).parent)
 if path not in sys.path:
     sys.path.insert(0, str(path))
 
 assert importlib.import_module("examples")
+
+
+@pytest.fixture
+def mkapi_config():
+    """Set the config of MkAPI loaded from options, and restore it afterwards."""
+    from mkapi.config import Config, get_config, set_config
+
+    config = get_config()
+
+    def load(options: dict, config_file_path: str | None = None) -> Config:
+        config_: Config = Config(config_file_path=config_file_path)  # type: ignore
+        config_.load_dict(options)
+        config_.validate()
+        set_config(config_)
+        return config_
+
+    yield load
+
+    set_config(config)
@@ -0,0 +1,58 @@
+import pytest
+
+from mkapi.parser import Parser, clear_cache, get_cache_info
+
+
+@pytest.fixture(autouse=True)
+def _clear():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_create_cache():
+    parser = Parser.create("mkapi.page.Page")
+    assert parser
+    assert Parser.create("mkapi.page.Page") is parser
+    info = get_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_create_cache_none():
+    assert Parser.create("invalid") is None
+    assert Parser.create("invalid") is None
+    assert get_cache_info().hits == 1
+
+
+def test_memoize():
+    parser = Parser.create("mkapi.page.Page")
+    assert parser
+    doc = parser.parse_doc()
+    assert parser.parse_doc() is doc
+
+
+def test_clear_cache_module():
+    parser = Parser.create("mkapi.page.Page")
+    assert parser
+    parser.parse_doc()
+    nav = Parser.create("mkapi.nav")
+    assert nav
+    size = get_cache_info().currsize
+    clear_cache("invalid")
+    assert get_cache_info().currsize == size
+    clear_cache("mkapi.page")
+    assert get_cache_info().currsize < size
+    assert Parser.create("mkapi.nav") is nav
+    assert Parser.create("mkapi.page.Page") is not parser
+
+
+def test_clear_cache_all():
+    Parser.create("mkapi.page.Page")
+    Parser.create("mkapi.page.Page")
+    clear_cache()
+    info = get_cache_info()
+    assert info.hits == 0
+    assert info.misses == 0
+    assert info.currsize == 0
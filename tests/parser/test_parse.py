@@ -341,7 +341,7 @@ def test_parsr_doc_summary_functions():
     doc = parser.parse_doc()
     section = find_item_by_name(doc.sections, "Functions")
     assert section
-    assert len(section.items) == 6
+    assert len(section.items) == 10
 
 
 def test_parsr_doc_summary_methods():
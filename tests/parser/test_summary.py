@@ -76,3 +76,40 @@ def test_modules_from_module_file_not_package():
 
     section = create_modules_from_module_file("examples.mod_a")
     assert not section
+
+
+def test_create_summary():
+    from mkapi.parser import Parser, create_summary
+
+    summary = create_summary("Parser.parse_name_set", "mkapi.parser")
+    assert summary
+    parser = Parser.create("Parser.parse_name_set", "mkapi.parser")
+    assert parser
+    name_set = parser.parse_name_set()
+    assert summary.name == name_set.name == "parse\\_name\\_set"
+    assert summary.id == name_set.id == "mkapi.parser.Parser.parse_name_set"
+    assert summary.text == parser.parse_summary()
+    assert "mkapi.parser" in summary.modules
+
+
+def test_create_summary_module():
+    from mkapi.parser import create_summary
+
+    summary = create_summary("examples.sub.subsub", None)
+    assert summary
+    assert summary.name == summary.id == "examples.sub.subsub"
+    assert not create_summary("invalid", None)
+
+
+def test_summary_index():
+    from mkapi.parser import clear_cache, get_summary, get_summary_index
+
+    clear_cache()
+    index = get_summary_index("astdoc.node")
+    assert index is get_summary_index("astdoc.node")
+    assert "Node" in index.sections["Classes"]
+    assert "iter_child_nodes" in index.sections["Functions"]
+    assert "Node.__init__" not in index.summaries
+    assert get_summary("Node", "astdoc.node") is index.summaries["Node"]
+    clear_cache("astdoc.node")
+    assert get_summary_index("astdoc.node") is not index
@@ -0,0 +1,55 @@
+import ast
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generate import Scale, generate_package, get_module_names
+from benchmarks.run import STAGES, format_results, main, run
+
+
+def test_generate_package(tmp_path: Path):
+    scale = Scale(modules=12, classes=2, methods=3, doc_lines=1, refs=2)
+    path = generate_package(tmp_path, "pkg", scale)
+    assert (path / "sub1" / "mod1.py").exists()
+    assert not (path / "sub1" / "mod2.py").exists()
+
+    source = (path / "sub0" / "mod0.py").read_text()
+    tree = ast.parse(source)
+    classes = [n for n in tree.body if isinstance(n, ast.ClassDef)]
+    assert len(classes) == 2
+    assert len(classes[0].body) == 2 + 3
+    assert "[Class" in source
+
+    names = get_module_names("pkg", scale)
+    assert len(names) == 12
+    assert names[-1] == "pkg.sub1.mod1"
+
+
+def test_run():
+    scale = Scale(modules=2, classes=1, methods=1, doc_lines=1, refs=1)
+    result = run(scale, memory=False)
+    assert result.pages == 2 * (1 + 1 + 2)
+    assert set(result.times) == set(STAGES)
+    assert not result.peaks
+    assert not any(name.startswith("mkapi_benchmark") for name in sys.modules)
+
+    table = format_results([result])
+    assert table.splitlines()[2].split()[:2] == ["2", "8"]
+
+
+@pytest.fixture
+def _mkdocs_logger():
+    logger = logging.getLogger("mkdocs")
+    level = logger.level
+    yield
+    logger.setLevel(level)
+
+
+@pytest.mark.usefixtures("_mkdocs_logger")
+def test_main():
+    lines = []
+    main(["--modules", "1", "--classes", "1", "--methods", "0"], lines.append)
+    assert lines[0].startswith("Running benchmark: modules=1 classes=1 methods=0")
+    assert "build [MiB]" in lines[-1]
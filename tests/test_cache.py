@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+
+from mkapi.config import Config, get_config, set_config
+
+
+@pytest.fixture(autouse=True)
+def _config():
+    config = get_config()
+    set_config(Config())  # type: ignore
+    yield
+    set_config(config)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, mkapi_config):
+    mkapi_config({"cache": True, "cache_dir": str(tmp_path)})
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _load_templates():
+    from mkapi.renderer import load_templates
+
+    load_templates()
+
+
+def test_get_cache_dir_disabled():
+    from mkapi.cache import get_cache_dir
+
+    assert get_cache_dir() is None
+
+
+def test_get_cache_dir(cache_dir: Path):
+    from mkapi.cache import get_cache_dir
+
+    assert get_cache_dir() == cache_dir
+
+
+def test_get_cache_dir_relative(tmp_path: Path, mkapi_config):
+    from mkapi.cache import get_cache_dir
+
+    options = {"cache": True, "cache_dir": ".cache/mkapi"}
+    mkapi_config(options, str(tmp_path / "mkdocs.yml"))
+    assert get_cache_dir() == tmp_path / ".cache/mkapi"
+
+
+def test_get_key_disabled():
+    from mkapi.cache import get_key
+
+    assert get_key("a.md", "# ::: mkapi.page", "mkapi.page", None) is None
+
+
+def test_get_key(cache_dir: Path):
+    from mkapi.cache import get_key
+
+    key = get_key("a.md", "# ::: mkapi.page", "mkapi.page", None)
+    assert key
+    assert key == get_key("a.md", "# ::: mkapi.page", "mkapi.page", None)
+    assert key != get_key("b.md", "# ::: mkapi.page", "mkapi.page", None)
+    assert key != get_key("a.md", "## ::: mkapi.page", "mkapi.page", None)
+    assert get_key("a.md", "# ::: invalid", "invalid", None) is None
+
+
+def test_get_module_hash():
+    from mkapi.cache import get_module_hash
+
+    x = get_module_hash("mkapi.cache")
+    assert x
+    assert len(x) == 64
+    assert get_module_hash("invalid") is None
+
+
+def test_save_load(cache_dir: Path):
+    from mkapi.cache import counts, load, save
+
+    counts.clear()
+    assert load("abcdef") is None
+    save("abcdef", "markdown", ["mkapi.page", "mkapi.cache"])
+    assert load("abcdef") == ("markdown", ["mkapi.cache", "mkapi.page"])
+    assert (cache_dir / "markdown/ab/abcdef.json").exists()
+    assert counts == {"hit": 1, "miss": 1}
+
+
+def test_load_modified(cache_dir: Path):
+    import json
+
+    from mkapi.cache import counts, load, save
+
+    counts.clear()
+    save("abcdef", "markdown", ["mkapi.cache"])
+    path = cache_dir / "markdown/ab/abcdef.json"
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    entry["modules"]["mkapi.cache"] = "modified"
+    path.write_text(json.dumps(entry), encoding="utf-8")
+    assert load("abcdef") is None
+    assert counts == {"miss": 1}
+
+
+def test_convert_markdown_cache(cache_dir: Path):
+    import json
+
+    from mkapi.cache import counts
+    from mkapi.graph import DEPENDENCIES, recording
+    from mkapi.page import URIS, convert_markdown
+
+    URIS.clear()
+    counts.clear()
+    with recording("a.md") as modules:
+        m = convert_markdown("# ::: examples", "a.md", ("object", "source"))
+    assert 'id="examples"' in m
+    assert "examples.a" in modules
+    paths = list(cache_dir.glob("markdown/*/*.json"))
+    assert len(paths) == 1
+
+    entry = json.loads(paths[0].read_text(encoding="utf-8"))
+    assert "examples.a" in entry["modules"]
+    entry["markdown"] = "cached"
+    paths[0].write_text(json.dumps(entry), encoding="utf-8")
+
+    with recording("a.md") as modules_:
+        m = convert_markdown("# ::: examples", "a.md", ("object", "source"))
+    assert m == "cached"
+    assert modules_ == modules
+    assert counts == {"hit": 1, "miss": 1}
+    DEPENDENCIES.clear()
@@ -0,0 +1,148 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear():
+    from mkapi.graph import DEPENDENCIES, LISTINGS, MTIMES
+    from mkapi.renderer import load_templates
+
+    load_templates()
+    DEPENDENCIES.clear()
+    MTIMES.clear()
+    LISTINGS.clear()
+    yield
+    DEPENDENCIES.clear()
+    MTIMES.clear()
+    LISTINGS.clear()
+
+
+def test_record_without_recording():
+    from mkapi.graph import DEPENDENCIES, record
+
+    record("mkapi.graph")
+    assert not DEPENDENCIES
+
+
+def test_recording():
+    from mkapi.graph import DEPENDENCIES, record, recording
+
+    with recording("a.md") as modules:
+        record("mkapi.graph.record")
+        record("invalid")
+        record(None)
+
+    assert modules == {"mkapi.graph"}
+    assert DEPENDENCIES["a.md"] is modules
+
+
+def test_page_dependencies():
+    from mkapi.graph import DEPENDENCIES
+    from mkapi.page import Page
+
+    page = Page.create_object("api/examples/README.md", "examples")
+    page.generate_markdown()
+    page.convert_markdown("")
+    modules = DEPENDENCIES[page.src_uri]
+    assert "examples" in modules
+    assert "examples.a" in modules
+    assert "examples.b" in modules
+
+
+def test_page_dependencies_base_class():
+    from mkapi.graph import DEPENDENCIES
+    from mkapi.page import Page
+
+    page = Page.create_object("a.md", "jinja2.nativetypes.NativeEnvironment")
+    page.generate_markdown()
+    page.convert_markdown("")
+    modules = DEPENDENCIES[page.src_uri]
+    assert "jinja2.nativetypes" in modules
+    assert "jinja2.environment" in modules
+
+
+def test_page_dependencies_documentation():
+    from mkapi.graph import DEPENDENCIES
+    from mkapi.page import Page
+
+    page = Page.create_documentation("usage/a.md")
+    page.convert_markdown("# Title\n\n::: examples\n")
+    modules = DEPENDENCIES[page.src_uri]
+    assert "examples" in modules
+    assert "examples.a" in modules
+
+
+def test_is_modified():
+    from mkapi.graph import DEPENDENCIES, is_modified
+
+    assert is_modified("a.md", 0) is None
+
+    DEPENDENCIES["a.md"] = {"mkapi.graph"}
+    assert is_modified("a.md", 0) is True
+    assert is_modified("a.md", time.time() + 1000) is False
+
+    DEPENDENCIES["a.md"] = {"mkapi.graph", "invalid"}
+    assert is_modified("a.md", time.time() + 1000) is True
+
+
+def test_save_load(tmp_path: Path):
+    from mkapi.graph import DEPENDENCIES, load, save
+
+    DEPENDENCIES["a.md"] = {"x", "y"}
+    path = tmp_path / "graph.json"
+    save(path)
+    DEPENDENCIES.clear()
+    load(path)
+    assert {"a.md": {"x", "y"}} == DEPENDENCIES
+    load(tmp_path / "invalid.json")
+    assert {"a.md": {"x", "y"}} == DEPENDENCIES
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from astdoc.utils import get_module_path
+
+    from mkapi.graph import LISTINGS, MTIMES
+
+    path = tmp_path / "mkapi_graph_package"
+    path.mkdir()
+    (path / "__init__.py").write_text("")
+    (path / "a.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    get_module_path.cache_clear()
+    yield path
+    sys.modules.pop("mkapi_graph_package", None)
+    get_module_path.cache_clear()
+    MTIMES.clear()
+    LISTINGS.clear()
+
+
+def test_get_modified_modules(package: Path):
+    import os
+
+    from mkapi.graph import get_modified_modules, snapshot
+
+    assert get_modified_modules() is None
+
+    snapshot(["mkapi_graph_package", "mkapi_graph_package.a", "invalid"])
+    assert get_modified_modules() == set()
+
+    os.utime(package / "a.py", (0, 0))
+    assert get_modified_modules() == {"mkapi_graph_package.a"}
+
+    (package / "a.py~").write_text("")
+    assert get_modified_modules() == {"mkapi_graph_package.a"}
+
+    (package / "b.py").write_text("")
+    assert get_modified_modules() is None
+
+
+def test_get_modified_modules_removed(package: Path):
+    from mkapi.graph import get_modified_modules, snapshot
+
+    snapshot(["mkapi_graph_package.a"])
+    (package / "a.py").unlink()
+    assert get_modified_modules() is None
@@ -1,3 +1,7 @@
+import sys
+from pathlib import Path
+
+import pytest
 import yaml
 from astdoc.utils import is_package
 
@@ -149,3 +153,102 @@ def test_update_nav():
     update_nav(nav, create_page, page_title=page_title)
     assert "MKAPI.PAGE.0" in nav[1]
     assert nav[1]["MKAPI.PAGE.0"] == "api1/mkapi.page.md"
+
+
+@pytest.fixture(autouse=True)
+def _clear_directories():
+    from mkapi.nav import _directories
+
+    _directories.clear()
+    yield
+    _directories.clear()
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from astdoc.utils import get_module_path
+
+    path = tmp_path / "mkapi_nav_package"
+    (path / "sub").mkdir(parents=True)
+    (path / "__init__.py").write_text("")
+    (path / "a.py").write_text("")
+    (path / "sub" / "__init__.py").write_text("")
+    (path / "sub" / "b.py").write_text("")
+    (path / "data").mkdir()
+    (path / "data" / "c.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    get_module_path.cache_clear()
+    yield path
+    sys.modules.pop("mkapi_nav_package", None)
+    get_module_path.cache_clear()
+
+
+def test_get_package_tree(package: Path):
+    import os
+
+    from mkapi.nav import get_package_tree
+
+    tree = get_package_tree("mkapi_nav_package")
+    assert tree == [
+        ("mkapi_nav_package.sub", [("mkapi_nav_package.sub.b", None)]),
+        ("mkapi_nav_package.a", None),
+    ]
+    assert get_package_tree("mkapi_nav_package") == tree
+    tree = get_package_tree("mkapi_nav_package", recursive=False)
+    assert tree == [("mkapi_nav_package.sub", []), ("mkapi_nav_package.a", None)]
+    assert get_package_tree("mkapi_nav_package.a") is None
+    assert get_package_tree("invalid") is None
+
+    (package / "data" / "__init__.py").write_text("")
+    os.utime(package / "data", (0, 0))
+    tree = get_package_tree("mkapi_nav_package")
+    assert tree
+    assert tree[0] == ("mkapi_nav_package.data", [("mkapi_nav_package.data.c", None)])
+
+
+def test_scan_packages(package: Path):
+    from mkapi.nav import _directories, get_apinav, scan_packages
+
+    packages = [("mkapi_nav_package", 2), ("mkapi_nav_package.sub", 1)]
+    paths = scan_packages([*packages, ("mkapi_nav_package", 1), ("invalid", 1)])
+    assert paths == [str(package), str(package / "sub")]
+    assert set(_directories) == {str(package), str(package / "sub")}
+    nav = get_apinav("mkapi_nav_package", 2, lambda name: not name.endswith(".b"))
+    assert nav == ["mkapi_nav_package", "mkapi_nav_package.sub", "mkapi_nav_package.a"]
+
+
+def test_scan_packages_depth(package: Path):
+    from mkapi.nav import _directories, get_apinav, scan_packages
+
+    scan_packages([("mkapi_nav_package", 1)])
+    assert list(_directories) == [str(package)]
+    nav = get_apinav("mkapi_nav_package", 1)
+    assert nav == ["mkapi_nav_package", "mkapi_nav_package.sub", "mkapi_nav_package.a"]
+    assert list(_directories) == [str(package)]
+
+
+def test_scan_packages_prune(package: Path):
+    from mkapi.nav import _directories, get_apinav, scan_packages
+
+    def predicate(name: str) -> bool:
+        return not name.endswith(".sub")
+
+    scan_packages([("mkapi_nav_package", 3)], predicate)
+    assert list(_directories) == [str(package)]
+    nav = get_apinav("mkapi_nav_package", 3, predicate)
+    assert nav == [{"mkapi_nav_package": ["mkapi_nav_package", "mkapi_nav_package.a"]}]
+    assert list(_directories) == [str(package)]
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["a", "a.b", "a.b.c", "a.bc", "x.tests", "x.tests.y", "a.b.c.test_d", "[a]"],
+)
+def test_compile_exclude(name: str):
+    import fnmatch
+
+    from mkapi.nav import compile_exclude
+
+    patterns = ["a.b.*", "*.tests", "*.test_?", "[[]a]", "x.*.y"]
+    is_excluded = compile_exclude(patterns)
+    assert is_excluded(name) == any(fnmatch.fnmatch(name, p) for p in patterns)
@@ -85,6 +85,49 @@ def test_generate_module_markdown_alias():
     assert "examples.ExampleClassB" in names
 
 
+def test_generate_module_markdown_lines():
+    from astdoc.object import get_object
+
+    from mkapi.page import generate_module_markdown
+
+    obj = get_object("astdoc.doc.merge")
+    assert obj
+    line = obj.node.lineno
+
+    m, names = generate_module_markdown("astdoc.doc", (1, line - 1))
+    assert "astdoc.doc" in names
+    assert "astdoc.doc.Item" in names
+    assert "astdoc.doc.merge" not in names
+
+    m, names = generate_module_markdown("astdoc.doc", (line, line))
+    assert m == "# ::: astdoc.doc\n## ::: merge astdoc.doc"
+    assert names == ["astdoc.doc.merge"]
+
+
+def test_get_source_chunks():
+    from mkapi.page import get_source_chunks
+
+    assert get_source_chunks("astdoc.doc", 0) == []
+    assert get_source_chunks("astdoc.doc", 100000) == []
+    assert get_source_chunks("invalid", 100) == []
+
+    chunks = get_source_chunks("astdoc.doc", 100)
+    assert len(chunks) > 1
+    assert chunks[0][0] == 1
+    for (_, end), (start, _) in zip(chunks, chunks[1:], strict=False):
+        assert start == end + 1
+
+
+def test_create_markdown_chunk_links():
+    from mkapi.page import Page
+
+    uris = ["src/a.md", "src/a/2.md", "src/a/3.md"]
+    page = Page.create_source(uris[1], "astdoc.doc", (1, 10))
+    page.chunk_uris = uris
+    m = page.create_markdown()
+    assert m.endswith("\n\nSource pages : [1](../a.md) **2** [3](3.md)")
+
+
 @pytest.fixture(scope="module")
 def convert_markdown():
     from mkapi.page import URIS, convert_markdown
@@ -228,6 +271,7 @@ def test_page_convert_object_page():
     p = Page.create_object("a/b.md", "mkapi.page")
     assert p
     p.generate_markdown()
+    p.register()
 
     assert p.markdown.startswith("# ::: mkapi.page\n")
     assert "## ::: Page mkapi.page\n" in p.markdown
@@ -237,6 +281,8 @@ def test_page_convert_object_page():
 
     m = p.convert_markdown("")
     assert "mkapi.page.Page.is_documentation_page" in m
+    assert not p.markdown
+    assert p.convert_markdown("") == m
 
 
 def test_page_convert_source_page():
@@ -249,6 +295,7 @@ def test_page_convert_source_page():
     p = Page.create_source("a/b.md", "mkapi.page")
     assert p
     p.generate_markdown()
+    p.register()
     m = p.convert_markdown("")
     assert "class Page:## __mkapi__.mkapi.page.Page" in m
 
@@ -259,3 +306,132 @@ def test_convert_markdown_failure():
     m = "::: a-b-c\n   abc"
     x = convert_markdown(m, "a", ("object", "source"))
     assert x == m
+
+
+def test_convert_markdown_single_pass():
+    from mkapi.page import URIS, convert_markdown, link_markdown, render_markdown
+    from mkapi.renderer import load_templates
+
+    load_templates()
+    URIS.clear()
+    URIS["object"] = {"mkapi.page.Page": "api/mkapi/page.md"}
+    URIS["source"] = {"mkapi.page.Page": "src/mkapi/page.md"}
+
+    m = "[Page][mkapi.page.Page]\n\n## ::: mkapi.page.Page\n\n"
+    m += "```\n[Page][mkapi.page.Page]\n::: mkapi.page\n```\n[`Page`][mkapi.page.Page]"
+    namespaces = ("object", "source")
+    x = convert_markdown(m, "a/b.md", namespaces)
+    y = render_markdown(m, "a/b.md", namespaces[1])
+    y = link_markdown(y, "a/b.md", namespaces[0])
+    assert x == y
+    assert x.startswith("[Page](../api/mkapi/page.md#mkapi.page.Page ")
+    assert "```\n[Page][mkapi.page.Page]\n::: mkapi.page\n```\n" in x
+    assert "[mkapi_source_mkapi](../src/mkapi/page.md#mkapi.page.Page " in x
+    URIS.clear()
+
+
+def test_get_relative_uri():
+    from mkapi.page import _get_relative_uri
+
+    assert _get_relative_uri("api/a/b.md", "api/c") == "../a/b.md"
+    assert _get_relative_uri("api/a/b.md", ".") == "api/a/b.md"
+    assert _get_relative_uri.cache_info().currsize
+
+
+def test_get_source_link_uri():
+    from mkapi.page import _get_source_link_uri
+
+    assert _get_source_link_uri("api/a/README.md", "src/a.md") == "../../api/a"
+    assert _get_source_link_uri("api/a/b.md", "src/a.md") == "../../api/a/b"
+
+
+def test_convert_html_without_markers():
+    from mkapi.page import convert_html
+
+    html = "<p>abc</p>"
+    assert convert_html(html, "a.md", "object") is html
+
+
+def test_convert_html():
+    from mkapi.page import URIS, convert_html
+
+    URIS.clear()
+    URIS["object"] = {"a.b": "api/a.md"}
+    html = '<h1 class="mkapi-heading" id="a">a mkapi_source_mkapi</h1>\n'
+    html += '<h2 class="mkapi-heading" id="b">b</h2>\n'
+    html += "<p>mkapi_object_mkapi mkapi_definition_mkapi</p>\n"
+    html += '<span class="c1">## __mkapi__.a.b</span>\n'
+    html += '<span class="c1">## __mkapi__.a.c</span>\n'
+    html += "<p>## __mkapi__.a.b</p>\n"
+    html += "<h2>mkapi-heading\n</h2>"
+    x = convert_html(html, "src/a.md", "object")
+    lines = x.splitlines()
+    assert lines[0].startswith('<h1 style="display: none;">a source</h1><p>[docs]')
+    assert lines[0].endswith('<i class="fa-solid fa-square-arrow-up-right"></i></p>')
+    assert lines[1].startswith('<div class="mkapi-source-link" id="a.b">')
+    assert 'href="../../api/a/#a.b"' in lines[1]
+    assert not lines[2]
+    assert lines[3] == "<p>## __mkapi__.a.b</p>"
+    assert lines[4] == "<h2>mkapi-heading"
+    URIS.clear()
+
+
+def test_get_member_index():
+    from mkapi.page import get_member_index
+
+    index = get_member_index("astdoc.doc")
+    assert index
+    names = [name for name, _ in index]
+    assert "Item" in names
+    assert "Item.clone" in names
+    assert all(lineno for _, lineno in index)
+    assert get_member_index("invalid") is None
+
+
+@pytest.mark.parametrize(
+    ("name", "lines"),
+    [
+        ("astdoc.doc", None),
+        ("astdoc.doc", (1, 100)),
+        ("astdoc.doc", (100, 200)),
+        ("examples", None),
+        ("astdoc.doc.Item", None),
+        ("astdoc.doc.Invalid", None),
+        ("invalid", None),
+    ],
+)
+def test_get_module_names(name: str, lines: tuple[int, int] | None):
+    from mkapi.page import generate_module_markdown, get_module_names
+
+    assert get_module_names(name, lines) == generate_module_markdown(name, lines)[1]
+
+
+def test_page_get_names():
+    from mkapi.page import URIS, Page
+
+    URIS.clear()
+    p = Page.create_object("a/b.md", "astdoc.doc.Item")
+    assert p.get_names() == ["astdoc.doc.Item", "astdoc.doc.Item.clone"]
+    p.register()
+    assert URIS["object"] == dict.fromkeys(p.get_names(), "a/b.md")
+    URIS.clear()
+
+
+@pytest.mark.parametrize("module", ["astdoc.doc", "jinja2.environment", "mkapi.page"])
+def test_filter_name(module: str):
+    from mkapi.page import _filter_name, get_member_index
+
+    members = get_member_index(module)
+    assert members
+    for name, _ in members:
+        x = [n for n, _ in members if n == name or n.startswith(f"{name}.")]
+        assert _filter_name(module, name) == x
+
+    assert _filter_name(module, "Invalid") == []
+
+
+def test_convert_markdown_without_markup():
+    from mkapi.page import convert_markdown
+
+    m = "# Title\n\n[link](a.md) `x` [y]\n"
+    assert convert_markdown(m, "a.md", ("object", "source")) is m
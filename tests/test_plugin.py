@@ -1,7 +1,9 @@
 import os
 import shutil
 import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from astdoc.utils import get_module_path
@@ -13,6 +15,7 @@ from mkdocs.plugins import PluginCollection
 from mkdocs.theme import Theme
 
 import mkapi
+from mkapi.config import set_config
 from mkapi.plugin import Config, Plugin
 
 
@@ -102,6 +105,7 @@ def config_plugin(tmp_path):
     plugin = config.plugins["mkapi"]
     assert isinstance(plugin, Plugin)
     plugin.__init__()
+    set_config(plugin.config)
 
     yield config, plugin
 
@@ -115,6 +119,14 @@ def config(config_plugin):
     return config_plugin[0]
 
 
+def reload(config: MkDocsConfig) -> MkDocsConfig:
+    # MkDocs loads the config file again for each build of `mkdocs serve`,
+    # while the plugin instance is kept.
+    reloaded = load_config(config.config_file_path)
+    assert reloaded.plugins["mkapi"] is config.plugins["mkapi"]
+    return reloaded
+
+
 def test_update_extensions(config: MkDocsConfig):
     from mkapi.plugin import _update_extensions
 
@@ -144,6 +156,16 @@ def test_on_config(config_plugin: tuple[MkDocsConfig, Plugin]):
     assert "src/example/sub/mod_b.md" in plugin.pages
 
 
+def test_update_nav_removed_module(config: MkDocsConfig):
+    from mkapi.page import Page
+    from mkapi.plugin import _update_nav
+
+    pages = {"api/mkapi/removed.md": Page.create_object("", "mkapi.removed")}
+    _update_nav(config, pages)
+    assert "api/mkapi/removed.md" not in pages
+    assert "api/mkapi/nav.md" in pages
+
+
 @pytest.mark.parametrize("dirty", [False, True])
 @pytest.mark.parametrize("save", [True, "output/markdown"])
 def test_build(config: MkDocsConfig, dirty: bool, save: bool | str):
@@ -170,6 +192,7 @@ def test_build(config: MkDocsConfig, dirty: bool, save: bool | str):
     assert pages["usage/object.md"].is_documentation_page()
     assert pages["api/mkapi/page.md"].is_object_page()
     assert pages["src/mkapi/page.md"].is_source_page()
+    assert plugin._skipped  # noqa: SLF001
 
     assert plugin.config.debug is True
 
@@ -183,3 +206,404 @@ def test_build(config: MkDocsConfig, dirty: bool, save: bool | str):
         path = Path(config.docs_dir) / "api/mkapi/page.md"
 
     assert path.exists()
+
+
+def test_build_lazy_source(config: MkDocsConfig):
+    config.plugins.on_startup(command="serve", dirty=False)
+    plugin = config.plugins["mkapi"]
+    assert isinstance(plugin, Plugin)
+    plugin.config.lazy_source = True
+
+    build(config)
+
+    path = Path(config.site_dir) / "src/mkapi/page/index.html"
+    html = path.read_text()
+    assert "The source is rendered when this page is requested." in html
+    assert 'id="mkapi.page.Page.convert_html"' in html
+    html = (Path(config.site_dir) / "api/mkapi/page/index.html").read_text()
+    assert "requested" not in html
+
+    calls = []
+    server = SimpleNamespace(
+        mount_path="/",
+        _epoch_cond=threading.Condition(),
+        _visible_epoch=0,
+        _wanted_epoch=0,
+        _serve_request=lambda *args: calls.append(args),
+    )
+    assert plugin.on_serve(server, config) is server  # type: ignore
+    server._serve_request({"PATH_INFO": "/src/mkapi/page/"}, None)  # noqa: SLF001
+    assert calls == [({"PATH_INFO": "/src/mkapi/page/"}, None)]
+
+    html = path.read_text()
+    assert "requested" not in html
+    assert 'id="mkapi.page.Page.convert_html"' in html
+
+    config = reload(config)
+    plugin.config.lazy_source = True
+    build(config)
+    assert "requested" not in path.read_text()
+    html = (Path(config.site_dir) / "src/mkapi/nav/index.html").read_text()
+    assert "requested" in html
+
+
+def test_mkdocs_internals(config: MkDocsConfig):
+    # Lazy source pages and the pages reused by `mkdocs serve` depend on
+    # these private parts of MkDocs. Without them, `lazy_source` is disabled.
+    import inspect
+
+    from mkdocs.commands.build import _build_page, _populate_page
+    from mkdocs.livereload import LiveReloadServer
+    from mkdocs.structure.files import File, Files
+    from mkdocs.structure.pages import Page as MkDocsPage
+
+    from mkapi.plugin import _Rendered
+
+    params = list(inspect.signature(_populate_page).parameters)
+    assert params[:3] == ["page", "config", "files"]
+    params = list(inspect.signature(_build_page).parameters)
+    assert params[:5] == ["page", "config", "doc_files", "nav", "env"]
+
+    server = LiveReloadServer(lambda: None, "127.0.0.1", 0, config.site_dir)
+    params = list(inspect.signature(server._serve_request).parameters)  # noqa: SLF001
+    assert params == ["environ", "start_response"]
+    assert isinstance(server._epoch_cond, threading.Condition)  # noqa: SLF001
+    assert server._visible_epoch == server._wanted_epoch  # noqa: SLF001
+    assert server.mount_path == "/"
+    server.server_close()
+
+    file = File("index.md", config.docs_dir, config.site_dir, use_directory_urls=True)
+    page = MkDocsPage(None, file, config)
+    page.read_source(config)
+    page.render(config, Files([file]))
+    rendered = _Rendered.create(page, page.content or "")
+    assert rendered.title == page.title
+    assert rendered.present_anchor_ids == page.present_anchor_ids
+
+    page_ = MkDocsPage(None, file, config)
+    page_.read_source(config)
+    assert rendered.restore(page_) == page.content
+    assert page_.title == page.title
+    assert page_.present_anchor_ids == page.present_anchor_ids
+
+
+def test_lazy_source_unsupported(
+    config_plugin: tuple[MkDocsConfig, Plugin],
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    import mkdocs.commands.build
+
+    from mkapi.plugin import _supports_lazy_source
+
+    assert _supports_lazy_source()
+    monkeypatch.delattr(mkdocs.commands.build, "_build_page")
+    assert not _supports_lazy_source()
+
+    config, plugin = config_plugin
+    plugin.config.lazy_source = True
+    plugin.on_config(config)
+    assert plugin.config.lazy_source is False
+    assert "lazy_source is disabled" in caplog.text
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_build_dirty_uris(config: MkDocsConfig, cache: bool):
+    from mkapi.page import URIS
+
+    config.plugins.on_startup(command="build", dirty=False)
+    plugin = config.plugins["mkapi"]
+    assert isinstance(plugin, Plugin)
+    plugin.config.cache = cache
+
+    URIS.clear()
+    build(config)
+    uris = {namespace: uris.copy() for namespace, uris in URIS.items()}
+    assert uris["object"]["mkapi.page.Page"] == "api/mkapi/page.md"
+
+    # The name of an object removed since the previous build.
+    URIS["object"]["mkapi.page.removed"] = "api/mkapi/page.md"
+    config = reload(config)
+    plugin.config.cache = cache
+    config.plugins.on_startup(command="build", dirty=True)
+    build(config, dirty=True)
+    assert dict(URIS) == uris
+
+
+def test_build_dirty_graph(config: MkDocsConfig, monkeypatch: pytest.MonkeyPatch):
+    import mkapi.graph
+
+    # The finder of "." in `sys.path` is bound to the first current directory.
+    monkeypatch.syspath_prepend(str(Path.cwd()))
+    path = Path("mkapi_dirty_package")
+    path.mkdir()
+    (path / "__init__.py").write_text('"""Package."""\n')
+    (path / "a.py").write_text('"""Module A."""\n')
+    text = Path("mkdocs.yaml").read_text()
+    text = text.replace("nav:\n", "nav:\n  - Dirty: $api:src/mkapi_dirty_package.*\n")
+    Path("mkdocs.yaml").write_text(text)
+
+    config = reload(config)
+    config.plugins.on_startup(command="build", dirty=False)
+    plugin = config.plugins["mkapi"]
+    assert isinstance(plugin, Plugin)
+    plugin.config.cache = True
+
+    build(config)
+    assert Path(".cache/plugin/mkapi/graph.json").exists()
+    index = Path(config.site_dir) / "api/mkapi_dirty_package/index.html"
+    assert "Module A." in index.read_text()
+
+    (path / "a.py").write_text('"""Module B."""\n')
+    mtime = index.stat().st_mtime + 10
+    os.utime(path / "a.py", (mtime, mtime))
+    mkapi.graph.DEPENDENCIES.clear()
+
+    config = reload(config)
+    plugin.config.cache = True
+    config.plugins.on_startup(command="build", dirty=True)
+    build(config, dirty=True)
+    assert "Module B." in index.read_text()
+
+    sys.modules.pop("mkapi_dirty_package", None)
+    sys.modules.pop("mkapi_dirty_package.a", None)
+
+
+def test_build_serve_reuse(config: MkDocsConfig, monkeypatch: pytest.MonkeyPatch):
+    import mkapi.graph
+    from mkapi.page import Page
+
+    config.plugins.on_startup(command="serve", dirty=False)
+    plugin = config.plugins["mkapi"]
+    assert isinstance(plugin, Plugin)
+
+    def get_article() -> str:
+        path = Path(config.site_dir) / "api/mkapi/nav/index.html"
+        html = path.read_text()
+        return html[html.index("<article") : html.index("</article>")]
+
+    build(config)
+    article = get_article()
+    assert "api/mkapi/nav.md" in plugin._rendered  # noqa: SLF001
+
+    converted = []
+    convert_markdown = Page.convert_markdown
+
+    def convert(self: Page, markdown: str) -> str:
+        converted.append(self.src_uri)
+        return convert_markdown(self, markdown)
+
+    monkeypatch.setattr(Page, "convert_markdown", convert)
+    monkeypatch.setattr(mkapi.graph, "get_modified_modules", set)
+    config = reload(config)
+    build(config)
+    assert get_article() == article
+    assert "api/mkapi/nav.md" not in converted
+    assert "usage/object.md" in converted
+
+    converted.clear()
+    monkeypatch.setattr(mkapi.graph, "get_modified_modules", lambda: {"mkapi.nav"})
+    config = reload(config)
+    build(config)
+    assert get_article() == article
+    assert "api/mkapi/nav.md" in converted
+    assert "src/mkapi/nav.md" in converted
+    assert "api/mkapi/page.md" not in converted
+
+    converted.clear()
+    monkeypatch.setattr(mkapi.graph, "get_modified_modules", lambda: None)
+    config = reload(config)
+    build(config)
+    assert get_article() == article
+    assert "api/mkapi/page.md" in converted
+
+
+def test_build_serve_exclude(config: MkDocsConfig):
+    config.plugins.on_startup(command="serve", dirty=False)
+    plugin = config.plugins["mkapi"]
+    assert isinstance(plugin, Plugin)
+
+    build(config)
+    assert "api/mkapi/nav.md" in plugin.pages
+    assert "src/mkapi/nav.md" in plugin.pages
+
+    config = reload(config)
+    plugin.config.exclude = [*plugin.config.exclude, "mkapi.nav"]
+    build(config)
+    assert "api/mkapi/nav.md" not in plugin.pages
+    assert "src/mkapi/nav.md" not in plugin.pages
+    assert "api/mkapi/page.md" in plugin.pages
+    site = Path(config.site_dir)
+    assert not (site / "api/mkapi/nav/index.html").exists()
+    assert (site / "api/mkapi/page/index.html").exists()
+
+
+def test_build_source_max_lines(config: MkDocsConfig):
+    import re
+
+    config.plugins.on_startup(command="build", dirty=False)
+    plugin = config.plugins["mkapi"]
+    assert isinstance(plugin, Plugin)
+    plugin.config.source_max_lines = 200
+
+    build(config)
+
+    page = plugin.pages["src/mkapi/page.md"]
+    assert page.lines
+    assert page.lines[0] == 1
+    assert page.chunk_uris[0] == "src/mkapi/page.md"
+    assert page.chunk_uris[1] == "src/mkapi/page/2.md"
+    assert "src/mkapi/config/2.md" not in plugin.pages
+
+    site = Path(config.site_dir)
+    html = (site / "api/mkapi/page/index.html").read_text()
+    m = re.search(r'href="([^"]+)#mkapi.page.convert_html" title="Go to source"', html)
+    assert m
+    uri = m.group(1).removeprefix("../../../")
+    assert uri.startswith("src/mkapi/page/")
+    assert uri != "src/mkapi/page/"
+
+    html = (site / uri / "index.html").read_text()
+    assert 'id="mkapi.page.convert_html"' in html
+    assert 'id="mkapi.page.Page"' not in html
+    assert "Source pages" in html
+    chunk = plugin.pages[f"{uri[:-1]}.md"]
+    assert chunk.lines
+    assert f'<span class="normal">{chunk.lines[0]}</span>' in html
+
+    html = (site / "src/mkapi/page/index.html").read_text()
+    assert 'id="mkapi.page.PageKind"' in html
+    assert 'id="mkapi.page.convert_html"' not in html
+
+
+def test_prerender_pages():
+    from mkapi.page import URIS, Page
+    from mkapi.plugin import _prerender_pages
+    from mkapi.renderer import load_templates
+
+    load_templates()
+
+    def create_pages():
+        return [
+            Page.create_object("api/mkapi/nav.md", "mkapi.nav"),
+            Page.create_object("api/mkapi/page.md", "mkapi.page"),
+            Page.create_source("src/mkapi/nav.md", "mkapi.nav"),
+        ]
+
+    URIS.clear()
+    pages = create_pages()
+    for page in pages:
+        page.register()
+    for page in pages:
+        page.generate_markdown()
+    uris = {k: v.copy() for k, v in URIS.items()}
+    markdowns = [page.convert_markdown("") for page in pages]
+
+    URIS.clear()
+    pages = create_pages()
+    _prerender_pages(pages, 2)
+    assert not URIS
+    for page in pages:
+        page.register()
+    assert uris == URIS
+    assert all(page.rendered for page in pages)
+    assert [page.convert_markdown("") for page in pages] == markdowns
+    assert not any(page.rendered for page in pages)
+
+
+def test_prerender_pages_cold(monkeypatch: pytest.MonkeyPatch):
+    from astdoc.markdown import EXAMPLE_CLASS
+    from astdoc.utils import cache_clear
+
+    import mkapi.graph
+    from mkapi.page import URIS, Page
+    from mkapi.plugin import _prerender_pages
+    from mkapi.renderer import load_templates
+
+    load_templates()
+    monkeypatch.setitem(EXAMPLE_CLASS, "input", "mkapi-example-input")
+    monkeypatch.setitem(EXAMPLE_CLASS, "output", "mkapi-example-output")
+
+    def create_pages():
+        return [
+            Page.create_object("api/jinja2/environment.md", "jinja2.environment"),
+            Page.create_object("api/jinja2/nativetypes.md", "jinja2.nativetypes"),
+        ]
+
+    URIS.clear()
+    mkapi.graph.DEPENDENCIES.clear()
+    cache_clear()
+    pages = create_pages()
+    for page in pages:
+        page.generate_markdown()
+    markdowns = [page.convert_markdown("") for page in pages]
+    assert '"mkapi-item-name">sandboxed<' in markdowns[1]
+
+    # No dependencies are known before the first build.
+    mkapi.graph.DEPENDENCIES.clear()
+    cache_clear()
+    pages = create_pages()
+    _prerender_pages(pages, 2)
+    assert [page.convert_markdown("") for page in pages] == markdowns
+    mkapi.graph.DEPENDENCIES.clear()
+
+
+def test_prerender_pages_error(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    from mkapi.page import Page
+    from mkapi.plugin import _prerender_pages
+
+    def render_markdown(self: Page) -> None:
+        raise ValueError(self.name)
+
+    monkeypatch.setattr(Page, "render_markdown", render_markdown)
+    pages = [
+        Page.create_object("api/mkapi/nav.md", "mkapi.nav"),
+        Page.create_object("api/mkapi/page.md", "mkapi.page"),
+    ]
+    _prerender_pages(pages, 2)
+    assert "api/mkapi/nav.md:ValueError: mkapi.nav" in caplog.text
+    assert "api/mkapi/page.md:ValueError: mkapi.page" in caplog.text
+    assert all(page.markdown for page in pages)
+    assert not any(page.rendered for page in pages)
+
+
+def test_preload():
+    import mkapi.graph
+    from mkapi.page import Page
+    from mkapi.plugin import _preload
+
+    pages = [Page.create_object("a.md", "c"), Page.create_object("b.md", "d")]
+    mkapi.graph.DEPENDENCIES.update({"a.md": {"a", "c"}, "b.md": {"b", "x"}})
+    assert _preload(pages, ["x", "a", "y", "b"]) == ["x", "a", "b"]
+    del mkapi.graph.DEPENDENCIES["b.md"]
+    assert _preload(pages, ["x", "a", "y", "b"]) == ["x", "a", "y", "b"]
+    mkapi.graph.DEPENDENCIES.clear()
+
+
+def test_clear_cache(monkeypatch: pytest.MonkeyPatch):
+    import mkapi.graph
+    from mkapi.parser import Parser, _parsers, clear_cache
+    from mkapi.plugin import _clear_cache
+
+    clear_cache()
+    assert Parser.create("mkapi.graph.record")
+    assert Parser.create("mkapi.nav.split_name_depth")
+    keys = set(_parsers)
+
+    monkeypatch.setattr(mkapi.graph, "get_modified_modules", set)
+    _clear_cache()
+    assert set(_parsers) == keys
+
+    # Parsers hold the objects of astdoc, which are cleared as a whole.
+    monkeypatch.setattr(mkapi.graph, "get_modified_modules", lambda: {"mkapi.nav"})
+    assert _clear_cache() == {"mkapi.nav"}
+    assert not _parsers
+
+    assert Parser.create("mkapi.graph.record")
+
+    monkeypatch.setattr(mkapi.graph, "get_modified_modules", lambda: None)
+    _clear_cache()
+    assert not _parsers
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def profile(tmp_path: Path, mkapi_config):
+    mkapi_config({"profile": str(tmp_path / "profile.json")})
+
+    from mkapi.profile import clear
+
+    clear()
+    yield tmp_path / "profile.json"
+    clear()
+
+
+def test_is_enabled():
+    from mkapi.profile import is_enabled
+
+    assert not is_enabled()
+
+
+def test_timer_disabled():
+    from mkapi.profile import phases, timer
+
+    with timer("nav", "a.md"):
+        pass
+
+    assert not phases
+
+
+def test_timer(profile: Path):
+    from mkapi.profile import pages, phases, timer
+
+    with timer("nav"):
+        pass
+
+    with timer("conversion", "a.md"):
+        pass
+
+    assert set(phases) == {"nav", "conversion"}
+    assert set(pages) == {"a.md"}
+    assert set(pages["a.md"]) == {"conversion"}
+
+
+def test_render(profile: Path):
+    from mkapi.profile import objects
+    from mkapi.renderer import load_templates, render
+
+    load_templates()
+    assert render("Page", "mkapi.page", 2, "object")
+    assert set(objects["mkapi.page.Page"]) == {
+        "parse_name_set",
+        "parse_signature",
+        "parse_doc",
+        "render_source",
+    }
+
+
+def test_save(profile: Path):
+    from mkapi.profile import objects, save, timer, update_objects
+
+    with timer("conversion", "a.md"):
+        pass
+
+    update_objects({"a": {"parse_doc": 2}, "b": {"parse_doc": 1, "parse_signature": 2}})
+    update_objects({"a": {"parse_doc": 2}})
+    assert objects["a"]["parse_doc"] == 4
+    save(profile, top=1)
+    report = json.loads(profile.read_text(encoding="utf-8"))
+    assert list(report["phases"]) == [
+        "nav",
+        "registration",
+        "generation",
+        "conversion",
+        "html",
+        "toc",
+    ]
+    assert report["pages"][0]["src_uri"] == "a.md"
+    assert report["objects"] == [{"id": "a", "total": 4, "parse_doc": 4}]
+
+
+def test_save_memory(profile: Path):
+    from mkapi.profile import get_peak_memory, memory, save
+
+    memory.update({"markdown": 1, "peak": get_peak_memory() or 0})
+    save(profile)
+    report = json.loads(profile.read_text(encoding="utf-8"))
+    assert report["memory"]["markdown"] == 1
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from astdoc.node import iter_module_members
 from astdoc.object import Module, get_object
@@ -22,6 +24,28 @@ def test_load_templates():
     assert "source" in templates
 
 
+def test_load_templates_reuse():
+    from mkapi.renderer import load_templates, templates
+
+    template = templates["object"]
+    load_templates()
+    assert templates["object"] is template
+
+
+def test_get_environment_bytecode_cache(tmp_path):
+    from pathlib import Path
+
+    import mkapi
+    from mkapi.renderer import get_environment
+
+    path = Path(mkapi.__file__).parent / "templates"
+    env = get_environment(path, tmp_path / "templates")
+    assert get_environment(path, tmp_path / "templates") is env
+    assert get_environment(path) is not env
+    env.get_template("object.jinja2")
+    assert list((tmp_path / "templates").iterdir())
+
+
 def test_render_heading_module():
     from mkapi.renderer import render_heading
 
@@ -137,6 +161,54 @@ def test_get_source_id_must_be_unique():
         assert s.count(f"## __mkapi__.mkapi.plugin.{name}\n") == 1
 
 
+def test_split_source():
+    from mkapi.renderer import split_source
+
+    obj = get_object("mkapi.renderer")
+    assert isinstance(obj, Module)
+    assert split_source(obj, 100000) == [(1, len(get_source_lines(obj)))]
+
+    chunks = split_source(obj, 50)
+    assert len(chunks) > 2
+    assert chunks[0][0] == 1
+    assert chunks[-1][1] == len(get_source_lines(obj))
+    for (_, end), (start, _) in zip(chunks, chunks[1:], strict=False):
+        assert start == end + 1
+
+
+def get_source_lines(obj):
+    from astdoc.object import get_source
+
+    return get_source(obj).splitlines()
+
+
+def test_render_source_lines():
+    from mkapi.renderer import render_source
+
+    obj = get_object("mkapi.renderer")
+    assert isinstance(obj, Module)
+    func = get_object("mkapi.renderer.render_source")
+    assert func
+    start, end = func.node.lineno, func.node.end_lineno
+    m = render_source(obj, lines=(start, end))
+    assert f'linenums="{start}"' in m
+    names = re.findall(r"## __mkapi__\.(\S+)", m)
+    assert names[0] == "mkapi.renderer.render_source"
+    assert all(name.startswith("mkapi.renderer.render_source") for name in names)
+
+
+def test_render_source_lines_marked_once():
+    from mkapi.renderer import _get_module_source, render_source, split_source
+
+    obj = get_object("mkapi.renderer")
+    assert isinstance(obj, Module)
+    _get_module_source.cache_clear()
+    chunks = split_source(obj, 50)
+    ms = [render_source(obj, lines=lines) for lines in chunks]
+    assert _get_module_source.cache_info().misses == 1
+    assert "".join(ms).count("## __mkapi__.mkapi.renderer.render_source\n") == 1
+
+
 @pytest.mark.parametrize(
     ("source", "expected"),
     [("a```b``c", 3), ("abc", 0)],
@@ -145,3 +217,99 @@ def test_find_max_backticks(source: str, expected: int):
     from mkapi.renderer import find_max_backticks
 
     assert find_max_backticks(source) == expected
+
+
+def _iter_parsers():
+    from astdoc.object import iter_objects
+    from astdoc.utils import find_submodule_names
+
+    for module in ["examples", *find_submodule_names("examples"), "mkapi.renderer"]:
+        if obj := get_object(module):
+            for child in iter_objects(obj):
+                if parser := Parser.create(child.fullname):
+                    yield parser
+
+
+@pytest.mark.parametrize("level", [0, 2])
+@pytest.mark.parametrize("namespace", ["object", "source"])
+def test_native_renderers_match_templates(level: int, namespace: str):
+    from mkapi.renderer import (
+        _render_document,
+        _render_heading,
+        _render_object,
+        templates,
+    )
+
+    n = 0
+    for parser in _iter_parsers():
+        name_set = parser.parse_name_set()
+        signature = parser.parse_signature()
+        doc = parser.parse_doc()
+        bases = parser.parse_bases()
+
+        expected = templates["heading"].render(
+            id=name_set.id,
+            fullname=name_set.fullname,
+            level=level,
+        )
+        assert _render_heading(name_set.id, name_set.fullname, level) == expected
+
+        expected = templates["object"].render(
+            kind=name_set.kind,
+            name=name_set.name,
+            parent=name_set.parent,
+            module=name_set.module,
+            fullname=name_set.fullname,
+            id=name_set.id,
+            obj_id=name_set.obj_id,
+            parent_id=name_set.parent_id,
+            level=level,
+            namespace=namespace,
+            signature=signature,
+            type_params=name_set.type_params,
+        )
+        assert _render_object(name_set, level, namespace, signature) == expected
+
+        expected = templates["document"].render(doc=doc, bases=bases)
+        assert _render_document(doc, bases) == expected
+        n += 1
+
+    assert n > 50
+
+
+def test_load_templates_native(monkeypatch: pytest.MonkeyPatch):
+    import mkapi.renderer
+    from mkapi.renderer import load_templates, render_heading
+
+    parser = Parser.create("examples.a")
+    assert parser
+    name_set = parser.parse_name_set()
+    expected = render_heading(name_set, 1)
+
+    def render(*args) -> str:
+        raise NotImplementedError
+
+    monkeypatch.setattr(mkapi.renderer, "_render_heading", render)
+    load_templates(native=False)
+    try:
+        assert render_heading(name_set, 1) == expected
+    finally:
+        load_templates()
+
+    with pytest.raises(NotImplementedError):
+        render_heading(name_set, 1)
+
+
+def test_render_custom_template():
+    from jinja2 import Template
+
+    from mkapi.renderer import load_templates, render_heading, templates
+
+    parser = Parser.create("examples.a")
+    assert parser
+    name_set = parser.parse_name_set()
+    templates["heading"] = Template("custom {{ fullname }}")
+    try:
+        assert render_heading(name_set, 1) == "custom examples.a"
+    finally:
+        load_templates()
@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+
+import pytest
+
+
+def test_write(tmp_path: Path):
+    from mkapi.writer import flush, write
+
+    path = tmp_path / "a/b/c.md"
+    write(path, "abc")
+    assert flush() == [path]
+    assert path.read_text(encoding="utf-8") == "abc"
+    assert flush() == []
+
+
+def test_write_unchanged(tmp_path: Path):
+    from mkapi.writer import flush, write
+
+    path = tmp_path / "a.md"
+    path.write_text("abc", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    write(path, "abc")
+    assert flush() == []
+    assert path.stat().st_mtime_ns == 0
+
+    write(path, "def")
+    assert flush() == [path]
+    assert path.read_text(encoding="utf-8") == "def"
+
+
+def test_write_many(tmp_path: Path):
+    from mkapi.writer import BATCH_SIZE, flush, write
+
+    paths = [tmp_path / f"{k}/{k}.md" for k in range(2 * BATCH_SIZE + 1)]
+    for k, path in enumerate(paths):
+        write(path, str(k))
+
+    assert flush() == paths
+    assert all(p.read_text(encoding="utf-8") == str(k) for k, p in enumerate(paths))
+
+
+def test_write_error(tmp_path: Path):
+    from mkapi.writer import flush, write
+
+    (tmp_path / "a").write_text("", encoding="utf-8")
+    write(tmp_path / "a/b.md", "abc")
+    with pytest.raises(OSError):  # noqa: PT011
+        flush()
+
+    assert flush() == []
+
+
+def test_is_unchanged(tmp_path: Path):
+    from mkapi.writer import is_unchanged
+
+    path = tmp_path / "a.md"
+    assert not is_unchanged(path, b"abc")
+    path.write_bytes(b"abc")
+    assert is_unchanged(path, b"abc")
+    assert not is_unchanged(path, b"ab")